@@ -1,11 +1,22 @@
 
+import sys
 import tkinter as tk
+from pathlib import Path
+
+# Project root on sys.path once at bootstrap, so library modules can do plain
+# `from config import ...` without touching sys.path themselves
+_ROOT = str(Path(__file__).resolve().parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
 from src.ui.window_setup import WeatherApp
 
+
 def main():
     root = tk.Tk()
-    WeatherApp(root)
+    app = WeatherApp(root)
     root.mainloop()
+    app.controller.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,3 @@
+"""
+Weather API clients (OpenWeatherMap + Open-Meteo): weather_api (sync) and weather_api_async.
+"""
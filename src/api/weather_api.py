@@ -2,48 +2,191 @@
 Weather API module - Handles all API interactions
 """
 
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone, timedelta
+from functools import lru_cache
+
+import numpy as np
+import orjson
 import requests
-import sys
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Add parent directory to path to import config
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config import API_URL, API_KEY
 
+# Shared session: keep-alive connection pooling to OpenWeatherMap and Open-Meteo
+# so repeated lookups skip the TCP + TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+))
+_SESSION.headers.update({'User-Agent': 'weather-app/1.0', 'Accept': 'application/json'})
 
-def fetch_weather_data(city):
+log = logging.getLogger(__name__)
+
+# Requests slower than this are logged at DEBUG level (useful for TTL tuning)
+SLOW_REQUEST_SECONDS = 1.0
+
+FORECAST_URL = 'https://api.openweathermap.org/data/2.5/forecast'
+OPENMETEO_UV_URL = 'https://api.open-meteo.com/v1/forecast'
+
+
+# ==================== Response Cache ====================
+# Responses are cached per full URL; TTLs are in seconds.
+
+CURRENT_TTL = 60
+FORECAST_TTL = 900
+DAILY_TTL = 1800
+UV_TTL = 600
+
+_cache = {}  # url or coordinate-bucket key -> (monotonic timestamp, payload)
+_cache_lock = threading.Lock()
+
+
+def _cache_lookup(url, ttl):
+    """Return the cached payload for url if it is younger than ttl, else None."""
+    with _cache_lock:
+        hit = _cache.get(url)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+    return None
+
+
+def _cache_stale(url):
+    """Return the cached payload for url regardless of age, or None."""
+    with _cache_lock:
+        hit = _cache.get(url)
+    return hit[1] if hit else None
+
+
+def _cache_store(url, payload):
+    with _cache_lock:
+        _cache[url] = (time.monotonic(), payload)
+
+
+def _valid_coords(lat, lon):
+    """True if lat/lon are present and in range (skips requests bound to fail)."""
+    return (lat is not None and lon is not None
+            and -90 <= lat <= 90 and -180 <= lon <= 180)
+
+
+def _coord_key(kind, lat, lon):
+    """Cache key for an Open-Meteo endpoint, bucketed to ~0.1° (about 11 km)."""
+    return (kind, round(lat, 1), round(lon, 1))
+
+
+def _get_json(url, *, label, ttl, timeout=5):
     """
-    Fetch weather data from OpenWeatherMap API.
+    GET url and decode JSON, serving from the cache while fresh.
+    
+    All fetchers share this error handling. If the request fails and a stale
+    cache entry exists, the stale payload is returned so the UI keeps showing
+    last-known data.
     
     Args:
-        city (str): City name to fetch weather for
+        url (str): Request URL
+        label (str): Endpoint name for error messages and timing logs
+        ttl (int): Cache lifetime in seconds
+        timeout (int): Request timeout in seconds
     
     Returns:
-        dict: Weather data if successful, None if error occurs
+        dict: Decoded JSON if successful, stale data or None if error occurs
+    """
+    return _request_json(url, label=label, ttl=ttl, timeout=timeout)[0]
+
+
+def _request_json(url, *, label, ttl, timeout=5):
+    """
+    _get_json that also reports where the payload came from.
     
-    Raises:
-        Prints error message to console
+    Returns:
+        tuple: (payload, fetched), where fetched is True only if payload was
+        just received from the server (not a cache hit or stale fallback)
     """
+    payload = _cache_lookup(url, ttl)
+    if payload is not None:
+        return payload, False
+    start = time.perf_counter()
     try:
-        url = f'{API_URL}?q={city}&appid={API_KEY}'
-        response = requests.get(url, timeout=5)
+        response = _SESSION.get(url, timeout=timeout)
         response.raise_for_status()
-        return response.json()
+        payload = orjson.loads(response.content)
     except requests.exceptions.Timeout:
-        print("Error: Request timed out")
-        return None
+        print(f"Error: {label} request timed out")
+        return _cache_stale(url), False
     except requests.exceptions.ConnectionError:
-        print("Error: Connection failed")
-        return None
+        print(f"Error: {label} connection failed")
+        return _cache_stale(url), False
     except requests.exceptions.HTTPError as e:
-        print(f"Error: HTTP error occurred - {e}")
-        return None
+        print(f"Error: {label} HTTP error occurred - {e}")
+        return _cache_stale(url), False
     except Exception as e:
-        print(f"Error fetching data: {e}")
-        return None
+        print(f"Error fetching {label} data: {e}")
+        return _cache_stale(url), False
+    finally:
+        elapsed = time.perf_counter() - start
+        if elapsed > SLOW_REQUEST_SECONDS:
+            log.debug("Slow %s request: %.2f s", label, elapsed)
+    _cache_store(url, payload)
+    return payload, True
 
 
-OPENMETEO_UV_URL = 'https://api.open-meteo.com/v1/forecast'
+def _get_coord_json(kind, url, lat, lon, *, label, ttl):
+    """_get_json for Open-Meteo, also cached by coordinate bucket (see _coord_key)."""
+    key = _coord_key(kind, lat, lon)
+    payload = _cache_lookup(key, ttl)
+    if payload is None:
+        payload, fetched = _request_json(url, label=label, ttl=ttl)
+        # Stale fallbacks must not be re-stamped as fresh for the whole bucket
+        if fetched:
+            _cache_store(key, payload)
+    return payload
+
+
+# ==================== Request URLs ====================
+# Shared with the async client (weather_api_async) so both build identical URLs.
+
+def _current_url(city):
+    return f'{API_URL}?q={city}&appid={API_KEY}'
+
+
+def _forecast_url(city):
+    return f'{FORECAST_URL}?q={city}&appid={API_KEY}'
+
+
+# Open-Meteo coordinates are rounded to 2 decimals so nearby lookups share URLs
+def _uv_url(lat, lon):
+    return f'{OPENMETEO_UV_URL}?latitude={lat:.2f}&longitude={lon:.2f}&current=uv_index'
+
+
+def _daily_url(lat, lon):
+    return (
+        f'{OPENMETEO_UV_URL}?latitude={lat:.2f}&longitude={lon:.2f}'
+        '&daily=temperature_2m_max,temperature_2m_min,weathercode'
+        '&forecast_days=15'
+    )
+
+
+def fetch_weather_data(city):
+    """
+    Fetch weather data from OpenWeatherMap API.
+    
+    Args:
+        city (str): City name to fetch weather for
+    
+    Returns:
+        dict: Weather data if successful, None if error occurs
+    
+    Raises:
+        Prints error message to console
+    """
+    return _get_json(_current_url(city), label='Weather', ttl=CURRENT_TTL)
 
 
 def fetch_uv_index_from_openmeteo(lat, lon):
@@ -57,17 +200,31 @@ def fetch_uv_index_from_openmeteo(lat, lon):
     Returns:
         float: UV index value, or None if fetch fails
     """
+    if not _valid_coords(lat, lon):
+        return None
+    result = _get_coord_json('uv', _uv_url(lat, lon), lat, lon, label='UV', ttl=UV_TTL)
     try:
-        url = f'{OPENMETEO_UV_URL}?latitude={lat}&longitude={lon}&current=uv_index'
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        result = response.json()
-        uv = result.get('current', {}).get('uv_index')
-        return float(uv) if uv is not None else None
-    except Exception:
+        return extract_uv_index(result)
+    except (TypeError, ValueError, AttributeError):
         return None
 
 
+def extract_uv_index(result):
+    """
+    Extract the current UV index from an Open-Meteo response.
+    
+    Args:
+        result (dict): Raw Open-Meteo response (or None)
+    
+    Returns:
+        float: UV index value, or None if missing
+    """
+    if not result:
+        return None
+    uv = result.get('current', {}).get('uv_index')
+    return float(uv) if uv is not None else None
+
+
 def uv_index_to_display(uv):
     """
     Format UV index for display: numeric value + WHO category.
@@ -80,7 +237,12 @@ def uv_index_to_display(uv):
     """
     if uv is None:
         return "N/A"
-    uv = float(uv)
+    # Round first so nearby readings share one cache entry
+    return _uv_display_cached(round(float(uv), 1))
+
+
+@lru_cache(maxsize=256)
+def _uv_display_cached(uv):
     if uv <= 2:
         cat = "Low"
     elif uv <= 5:
@@ -94,12 +256,13 @@ def uv_index_to_display(uv):
     return f"{uv:.1f} ({cat})"
 
 
-def parse_weather_data(data):
+def parse_weather_data(data, uv_value=None):
     """
     Parse weather data from API response.
     
     Args:
         data (dict): Raw API response data
+        uv_value: Pre-fetched UV index from Open-Meteo (float), or None
     
     Returns:
         dict: Parsed weather information with keys:
@@ -116,8 +279,6 @@ def parse_weather_data(data):
         Returns None if parsing fails
     """
     try:
-        from datetime import datetime
-        
         parsed = {
             'weather_condition': data['weather'][0]['main'],
             'description': data['weather'][0]['description'],
@@ -138,14 +299,8 @@ def parse_weather_data(data):
         else:
             parsed['visibility'] = None
         
-        # UV Index: fetch real data from Open-Meteo using lat/lon
-        uv_display = "N/A"
-        if 'coord' in data:
-            lat = data['coord'].get('lat')
-            lon = data['coord'].get('lon')
-            if lat is not None and lon is not None:
-                uv_value = fetch_uv_index_from_openmeteo(lat, lon)
-                uv_display = uv_index_to_display(uv_value)
+        # UV Index: real value from Open-Meteo (fetched by caller), or estimate
+        uv_display = uv_index_to_display(uv_value)
         if uv_display == "N/A":
             uv_display = calculate_uv_index_estimate(
                 parsed.get('sunrise'),
@@ -173,8 +328,6 @@ def calculate_uv_index_estimate(sunrise, sunset, weather_condition):
     Returns:
         str: UV index category
     """
-    from datetime import datetime
-    
     if not sunrise or not sunset:
         return "N/A"
     
@@ -210,25 +363,8 @@ def fetch_hourly_forecast(city):
     Returns:
         dict: Forecast data if successful, None if error occurs
     """
-    try:
-        # Use forecast endpoint for hourly data
-        forecast_url = 'https://api.openweathermap.org/data/2.5/forecast'
-        url = f'{forecast_url}?q={city}&appid={API_KEY}'
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.Timeout:
-        print("Error: Forecast request timed out")
-        return None
-    except requests.exceptions.ConnectionError:
-        print("Error: Forecast connection failed")
-        return None
-    except requests.exceptions.HTTPError as e:
-        print(f"Error: Forecast HTTP error occurred - {e}")
-        return None
-    except Exception as e:
-        print(f"Error fetching forecast data: {e}")
-        return None
+    # Use forecast endpoint for hourly data
+    return _get_json(_forecast_url(city), label='Forecast', ttl=FORECAST_TTL)
 
 
 def parse_hourly_forecast(forecast_data):
@@ -242,108 +378,54 @@ def parse_hourly_forecast(forecast_data):
     Returns:
         list: List of hourly forecast entries (24 hours), each with:
               - time: Hour string (e.g., "14:00")
+              - hour: Hour of day (0-23)
               - temperature: Temperature in Celsius
-              - icon: Weather icon emoji
               - condition: Weather condition
     """
     try:
-        from datetime import datetime, timezone, timedelta
-        
         hourly_list = []
         
-        if 'list' not in forecast_data or not forecast_data['list']:
+        # Forecast items (3-hour intervals, up to 24 hours = 8 items)
+        forecast_items = forecast_data.get('list', [])[:8]
+        if not forecast_items:
             return hourly_list
         
         timezone_offset = forecast_data.get('city', {}).get('timezone', 0)
         tz = timezone(timedelta(seconds=timezone_offset))
         
-        # Get forecast items (3-hour intervals, up to 24 hours = 8 items)
-        forecast_items = forecast_data['list'][:8]
-        
-        if not forecast_items:
-            return hourly_list
-        
-        # Parse all forecast points
-        forecast_points = []
-        for item in forecast_items:
-            dt_timestamp = item['dt']
-            dt_utc = datetime.fromtimestamp(dt_timestamp, tz=timezone.utc)
-            dt_local = dt_utc.astimezone(tz)
-            
-            temp_kelvin = item['main']['temp']
-            temp_celsius = temp_kelvin - 273.15
-            
-            weather_main = item['weather'][0]['main'].lower()
-            weather_desc = item['weather'][0]['description'].lower()
-            
-            # Store condition string - UI will convert to PNG icon
-            condition = item['weather'][0]['main']
-            
-            forecast_points.append({
-                'datetime': dt_local,
-                'temperature': temp_celsius,
-                'condition': condition  # UI will load PNG icon based on condition
-            })
+        # Forecast points: Unix timestamps, Celsius temperatures, and condition
+        # strings (UI will load PNG icon based on condition)
+        xs = np.array([item['dt'] for item in forecast_items], dtype=float)
+        ys = np.array([item['main']['temp'] for item in forecast_items]) - 273.15
+        conditions = [item['weather'][0]['main'] for item in forecast_items]
         
         # Generate hourly data by interpolating between 3-hour intervals
         current_time = datetime.now(tz)
         current_hour = current_time.replace(minute=0, second=0, microsecond=0)
+        target_hours = [current_hour + timedelta(hours=i) for i in range(24)]
+        targets = np.array([t.timestamp() for t in target_hours])
         
-        for i in range(24):
-            target_hour = current_hour + timedelta(hours=i)
-            
-            # Find the two forecast points that bracket this hour
-            prev_point = None
-            next_point = None
-            
-            for j, point in enumerate(forecast_points):
-                if point['datetime'] <= target_hour:
-                    prev_point = point
-                    if j + 1 < len(forecast_points):
-                        next_point = forecast_points[j + 1]
-                else:
-                    if not next_point:
-                        next_point = point
-                    break
-            
-            # If we only have one point (before or after), use it
-            if prev_point and not next_point:
-                temp = prev_point['temperature']
-                icon = prev_point['icon']
-            elif next_point and not prev_point:
-                temp = next_point['temperature']
-                icon = next_point['icon']
-            elif prev_point and next_point:
-                # Interpolate temperature between the two points
-                time_diff = (next_point['datetime'] - prev_point['datetime']).total_seconds() / 3600.0
-                if time_diff > 0:
-                    hours_from_prev = (target_hour - prev_point['datetime']).total_seconds() / 3600.0
-                    ratio = hours_from_prev / time_diff
-                    temp = prev_point['temperature'] + (next_point['temperature'] - prev_point['temperature']) * ratio
-                else:
-                    temp = prev_point['temperature']
-                
-                # Use condition from the nearest point
-                if hours_from_prev < time_diff / 2:
-                    condition = prev_point['condition']
-                else:
-                    condition = next_point['condition']
-            else:
-                # Fallback if no points found
-                temp = 20.0  # Default temperature
-                condition = 'Unknown'
-            
+        # np.interp clamps to the first/last point outside the forecast range
+        temps = np.interp(targets, xs, ys)
+        
+        # Use condition from the nearest bracketing point
+        last = len(xs) - 1
+        prev_idx = np.clip(np.searchsorted(xs, targets, side='right') - 1, 0, last)
+        next_idx = np.minimum(prev_idx + 1, last)
+        use_next = (targets - xs[prev_idx]) >= (xs[next_idx] - targets)
+        nearest_idx = np.where(use_next, next_idx, prev_idx)
+        
+        for target_hour, temp, idx in zip(target_hours, temps.tolist(), nearest_idx.tolist()):
             hourly_list.append({
                 'time': target_hour.strftime("%H:%M"),
                 'hour': target_hour.hour,
                 'temperature': temp,
-                'condition': condition  # UI will load PNG icon based on condition
+                'condition': conditions[idx]
             })
         
         return hourly_list
     except (KeyError, IndexError, TypeError) as e:
         print(f"Error parsing hourly forecast: {e}")
-        import traceback
         traceback.print_exc()
         return []
 
@@ -359,36 +441,42 @@ def fetch_daily_forecast(lat, lon):
     Returns:
         dict: Open-Meteo daily forecast data, or None if fetch fails
     """
-    try:
-        url = (
-            f'{OPENMETEO_UV_URL}?latitude={lat}&longitude={lon}'
-            '&daily=temperature_2m_max,temperature_2m_min,weathercode'
-            '&forecast_days=15'
-        )
-        response = requests.get(url, timeout=5)
-        response.raise_for_status()
-        return response.json()
-    except Exception:
+    if not _valid_coords(lat, lon):
         return None
+    return _get_coord_json('daily', _daily_url(lat, lon), lat, lon,
+                           label='Daily forecast', ttl=DAILY_TTL)
+
+
+def _build_wmo_table():
+    """Build a 100-entry tuple mapping WMO weather codes (0-99) to conditions."""
+    table = ['clouds'] * 100
+    table[0] = 'clear'
+    groups = {
+        'clouds': (1, 2, 3),
+        'fog': (45, 48),
+        'rain': (51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82),
+        'snow': (71, 73, 75, 77, 85, 86),
+        'thunderstorm': (95, 96, 99),
+        'drizzle': (52, 54),
+    }
+    for condition, codes in groups.items():
+        for c in codes:
+            table[c] = condition
+    return tuple(table)
+
+
+_WMO_TABLE = _build_wmo_table()
 
 
 def wmo_to_condition(code):
     """Map WMO weather code to condition string for icon lookup."""
-    if code is None or code == 0:
+    if code is None:
         return 'clear'
-    if code in (1, 2, 3):
+    try:
+        c = int(code)
+    except (TypeError, ValueError):
         return 'clouds'
-    if code in (45, 48):
-        return 'fog'
-    if code in (51, 53, 55, 56, 57, 61, 63, 65, 66, 67, 80, 81, 82):
-        return 'rain'
-    if code in (71, 73, 75, 77, 85, 86):
-        return 'snow'
-    if code in (95, 96, 99):
-        return 'thunderstorm'
-    if code in (52, 54):
-        return 'drizzle'
-    return 'clouds'
+    return _WMO_TABLE[c] if 0 <= c < len(_WMO_TABLE) else 'clouds'
 
 
 def parse_daily_forecast(openmeteo_data):
@@ -402,8 +490,6 @@ def parse_daily_forecast(openmeteo_data):
         list: Up to 15 daily entries with: day (e.g. "Mon 27"), condition,
               temperature_min, temperature_max
     """
-    from datetime import datetime
-    
     result = []
     try:
         daily = openmeteo_data.get('daily', {})
@@ -415,7 +501,7 @@ def parse_daily_forecast(openmeteo_data):
         for i in range(min(15, len(times))):
             date_str = times[i]
             try:
-                dt = datetime.strptime(date_str, '%Y-%m-%d')
+                dt = date.fromisoformat(date_str)
                 day_label = dt.strftime('%a %d')  # "Mon 27"
             except Exception:
                 day_label = date_str[:10] if len(date_str) >= 10 else date_str
@@ -440,6 +526,10 @@ def get_weather_info(city):
     """
     High-level function to fetch and parse weather information.
     
+    The current-weather and hourly-forecast requests only need the city name
+    and run concurrently; once coordinates are known, the UV and 15-day
+    requests run concurrently as well.
+    
     Args:
         city (str): City name
     
@@ -448,35 +538,63 @@ def get_weather_info(city):
     """
     if not city or not city.strip():
         return None
+    city = city.strip()
     
-    data = fetch_weather_data(city.strip())
-    if data is None:
-        return None
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_curr = ex.submit(fetch_weather_data, city)
+        f_hourly = ex.submit(fetch_hourly_forecast, city)
+        
+        data = f_curr.result()
+        if data is None:
+            return None
+        
+        # UV and 15-day forecast need lat/lon from current weather
+        coord = data.get('coord', {})
+        lat, lon = coord.get('lat'), coord.get('lon')
+        f_uv = f_daily = None
+        if lat is not None and lon is not None:
+            f_uv = ex.submit(fetch_uv_index_from_openmeteo, lat, lon)
+            f_daily = ex.submit(fetch_daily_forecast, lat, lon)
+        
+        return build_weather_info(
+            data,
+            uv_value=f_uv.result() if f_uv else None,
+            forecast_data=f_hourly.result(),
+            daily_data=f_daily.result() if f_daily else None,
+        )
+
+
+def build_weather_info(data, uv_value, forecast_data, daily_data):
+    """
+    Combine raw API responses into the dict returned by get_weather_info.
+    
+    Args:
+        data (dict): Raw current-weather response
+        uv_value: UV index (float) or None
+        forecast_data (dict): Raw 5-day/3-hour forecast response, or None
+        daily_data (dict): Raw Open-Meteo daily response, or None
     
-    parsed = parse_weather_data(data)
+    Returns:
+        dict: Parsed weather data or None if parsing fails
+    """
+    parsed = parse_weather_data(data, uv_value)
+    if parsed is None:
+        return None
     
-    # Also fetch hourly forecast
-    forecast_data = fetch_hourly_forecast(city.strip())
     if forecast_data:
         parsed['hourly_forecast'] = parse_hourly_forecast(forecast_data)
     else:
         parsed['hourly_forecast'] = []
     
-    # Fetch 15-day forecast using lat/lon from current weather
-    coord = data.get('coord', {})
-    lat, lon = coord.get('lat'), coord.get('lon')
-    if lat is not None and lon is not None:
-        daily_data = fetch_daily_forecast(lat, lon)
-        if daily_data:
-            parsed['daily_forecast'] = parse_daily_forecast(daily_data)
-        else:
-            parsed['daily_forecast'] = []
+    if daily_data:
+        parsed['daily_forecast'] = parse_daily_forecast(daily_data)
     else:
         parsed['daily_forecast'] = []
     
     return parsed
 
 
+@lru_cache(maxsize=256)
 def format_sunrise_sunset(timestamp, timezone_offset=0):
     """
     Format sunrise/sunset timestamp to readable time.
@@ -488,8 +606,6 @@ def format_sunrise_sunset(timestamp, timezone_offset=0):
     Returns:
         str: Formatted time string (e.g., "6:45 AM")
     """
-    from datetime import datetime, timezone, timedelta
-    
     if not timestamp:
         return "N/A"
     
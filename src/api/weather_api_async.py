@@ -0,0 +1,204 @@
+"""
+Async Weather API module - Fetches all endpoints concurrently with aiohttp
+"""
+
+import asyncio
+import logging
+
+import aiohttp
+import orjson
+
+from .weather_api import (
+    CURRENT_TTL,
+    FORECAST_TTL,
+    DAILY_TTL,
+    UV_TTL,
+    _cache_lookup,
+    _cache_stale,
+    _cache_store,
+    _coord_key,
+    _valid_coords,
+    _current_url,
+    _forecast_url,
+    _uv_url,
+    _daily_url,
+    extract_uv_index,
+    build_weather_info,
+)
+
+
+log = logging.getLogger(__name__)
+
+# Validators from the last 200 response per URL: url -> (etag, last_modified)
+_validators = {}
+
+
+def _conditional_headers(url, ttl):
+    """Request headers for url, including If-None-Match/If-Modified-Since when revalidating."""
+    headers = {'Cache-Control': f'max-age={ttl}'}
+    etag, last_modified = _validators.get(url, (None, None))
+    if _cache_stale(url) is not None:
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+async def _fetch_json(session, url, *, label, ttl):
+    """
+    Fetch a URL and decode the JSON body, sharing weather_api's TTL cache.
+    
+    Expired entries are revalidated with a conditional GET; on 304 the cached
+    body is reused and its age reset.
+    
+    Args:
+        session (aiohttp.ClientSession): Shared client session
+        url (str): Request URL
+        label (str): Endpoint name for log messages
+        ttl (int): Cache lifetime in seconds
+    
+    Returns:
+        dict: Decoded JSON if successful (or stale cached data if the request
+              fails), None if error occurs
+    """
+    return (await _request_json(session, url, label=label, ttl=ttl))[0]
+
+
+async def _request_json(session, url, *, label, ttl):
+    """
+    _fetch_json that also reports where the payload came from.
+    
+    Returns:
+        tuple: (payload, fetched), where fetched is True only if the server
+        just sent or confirmed (304) payload
+    """
+    payload = _cache_lookup(url, ttl)
+    if payload is not None:
+        return payload, False
+    try:
+        async with session.get(url, headers=_conditional_headers(url, ttl),
+                               timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status == 304:
+                payload = _cache_stale(url)
+                if payload is not None:
+                    _cache_store(url, payload)
+                return payload, payload is not None
+            response.raise_for_status()
+            payload = orjson.loads(await response.read())
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                _validators[url] = (etag, last_modified)
+    except asyncio.TimeoutError:
+        log.warning("%s request timed out", label)
+        return _cache_stale(url), False
+    except aiohttp.ClientConnectionError:
+        log.warning("%s connection failed", label)
+        return _cache_stale(url), False
+    except aiohttp.ClientResponseError as e:
+        log.warning("%s HTTP error occurred - %s", label, e)
+        return _cache_stale(url), False
+    except Exception as e:
+        log.warning("Error fetching %s data: %s", label, e)
+        return _cache_stale(url), False
+    _cache_store(url, payload)
+    return payload, True
+
+
+async def _fetch_coord_json(session, kind, url, lat, lon, *, label, ttl):
+    """
+    Fetch an Open-Meteo URL, also caching by coordinate bucket so nearby
+    cities share one request (same keys as weather_api).
+    """
+    key = _coord_key(kind, lat, lon)
+    payload = _cache_lookup(key, ttl)
+    if payload is None:
+        payload, fetched = await _request_json(session, url, label=label, ttl=ttl)
+        # Stale fallbacks must not be re-stamped as fresh for the whole bucket
+        if fetched:
+            _cache_store(key, payload)
+    return payload
+
+
+def create_session():
+    """
+    Create the client session used for weather requests.
+    
+    Must be called from inside the event loop that will use it. Keeping one
+    session alive across fetches reuses its pooled keep-alive connections.
+    
+    Returns:
+        aiohttp.ClientSession: New session (caller closes it)
+    """
+    connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+    headers = {'User-Agent': 'weather-app/1.0', 'Accept': 'application/json'}
+    return aiohttp.ClientSession(connector=connector, headers=headers)
+
+
+async def get_weather_info_async(city, session=None):
+    """
+    Fetch and parse weather information, issuing requests concurrently.
+    
+    Current weather and the hourly forecast are fetched together; once the
+    coordinates are known, UV index and the 15-day forecast are fetched together.
+    
+    Args:
+        city (str): City name
+        session (aiohttp.ClientSession): Optional long-lived session to reuse;
+            a temporary one is created (and closed) if omitted
+    
+    Returns:
+        dict: Parsed weather data (same format as weather_api.get_weather_info)
+              or None if error occurs
+    """
+    if not city or not city.strip():
+        return None
+    city = city.strip()
+    
+    if session is None:
+        async with create_session() as s:
+            return await get_weather_info_async(city, session=s)
+    
+    data, forecast_data = await asyncio.gather(
+        _fetch_json(session, _current_url(city), label='Weather', ttl=CURRENT_TTL),
+        _fetch_json(session, _forecast_url(city), label='Forecast', ttl=FORECAST_TTL),
+    )
+    if data is None:
+        return None
+    
+    coord = data.get('coord', {})
+    lat, lon = coord.get('lat'), coord.get('lon')
+    uv_result = daily_data = None
+    if _valid_coords(lat, lon):
+        uv_result, daily_data = await asyncio.gather(
+            _fetch_coord_json(session, 'uv', _uv_url(lat, lon), lat, lon, label='UV', ttl=UV_TTL),
+            _fetch_coord_json(session, 'daily', _daily_url(lat, lon), lat, lon,
+                              label='Daily forecast', ttl=DAILY_TTL),
+        )
+    
+    # A malformed UV payload only costs the UV field, as in the sync client
+    try:
+        uv_value = extract_uv_index(uv_result)
+    except (TypeError, ValueError, AttributeError):
+        uv_value = None
+    
+    return build_weather_info(
+        data,
+        uv_value=uv_value,
+        forecast_data=forecast_data,
+        daily_data=daily_data,
+    )
+
+
+def get_weather_info(city):
+    """
+    Synchronous wrapper around get_weather_info_async.
+    
+    Args:
+        city (str): City name
+    
+    Returns:
+        dict: Parsed weather data or None if error occurs
+    """
+    return asyncio.run(get_weather_info_async(city))
@@ -1,18 +1,21 @@
 """
 Load weather and detail icons from assets/icons SVG files and expose them as
-Tkinter PhotoImages. Uses svglib + ReportLab to render SVG to PIL, then ImageTk.
+Tkinter PhotoImages. Uses CairoSVG to render SVG to PIL, then ImageTk.
+Rendered PNGs are cached on disk so later launches skip rasterization.
 """
-import os
-import tempfile
+import io
+from collections import OrderedDict
 from pathlib import Path
 
+import cairosvg
 from PIL import Image, ImageTk
-from reportlab.graphics import renderPM
-from svglib.svglib import svg2rlg
 
 # Base path to assets/icons (project root / assets / icons)
 _ASSETS_DIR = Path(__file__).resolve().parent.parent.parent / "assets" / "icons"
 
+# Persistent cache of rendered PNGs, keyed by SVG name, mtime, color and size
+_PNG_CACHE_DIR = Path.home() / ".cache" / "weather-app" / "icons"
+
 # Map all icon names used in app (weather_api, theme, widgets) -> SVG basename (no .svg)
 WEATHER_ICON_TO_SVG = {
     "sun": "sun",
@@ -46,50 +49,53 @@ DETAIL_ICON_TO_SVG = {
     "uv": "sun",
 }
 
-_CACHE = {}
+# LRU of PhotoImages; old entries are evicted so memory stays bounded
+_CACHE = OrderedDict()
+_CACHE_MAX = 128
+
+
+def _png_cache_path(svg_path: Path, color: str, size_px: int) -> Path:
+    """Cache file for a rendered SVG; the source mtime invalidates stale renders."""
+    mtime = int(svg_path.stat().st_mtime)
+    return _PNG_CACHE_DIR / f"{svg_path.stem}_{mtime}_{color.lstrip('#')}_{size_px}.png"
 
 
 def _render_svg_to_pil(svg_path: Path, color: str, size_px: int) -> Image.Image:
     """Load SVG, replace currentColor with color, render to PIL Image at size_px x size_px."""
+    cache_path = _png_cache_path(svg_path, color, size_px)
+    if cache_path.exists():
+        try:
+            with Image.open(cache_path) as cached:
+                return cached.copy()
+        except OSError:
+            pass  # corrupt cache entry: render again and overwrite
+
+    img = _rasterize_svg(svg_path, color, size_px)
+    try:
+        _PNG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        img.save(cache_path, "PNG", optimize=True)
+    except OSError:
+        pass  # cache is best-effort (e.g. read-only home)
+    return img
+
+
+def _rasterize_svg(svg_path: Path, color: str, size_px: int) -> Image.Image:
+    """Render the SVG with CairoSVG (no caching)."""
     raw = svg_path.read_text(encoding="utf-8")
     # Replace currentColor so stroke/fill use our theme color
     colored = raw.replace("currentColor", color)
 
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".svg", delete=False, encoding="utf-8"
-    ) as f:
-        f.write(colored)
-        tmp_svg = f.name
-
-    try:
-        drawing = svg2rlg(tmp_svg)
-        if drawing is None:
-            raise ValueError(f"svglib could not parse {svg_path.name}")
-        # Optional: scale drawing for sharper output at small sizes
-        base = max(drawing.width, drawing.height, 24)
-        if base > 0:
-            scale = size_px / base
-            drawing.scale(scale, scale)
-            drawing.width = size_px
-            drawing.height = size_px
+    png_bytes = cairosvg.svg2png(
+        bytestring=colored.encode("utf-8"),
+        output_width=size_px,
+        output_height=size_px,
+    )
+    img = Image.open(io.BytesIO(png_bytes))
+    img.load()
 
-        try:
-            img = renderPM.drawToPIL(drawing)
-        except AttributeError:
-            tmp_png = tempfile.mktemp(suffix=".png")
-            try:
-                renderPM.drawToFile(drawing, tmp_png, fmt="PNG")
-                img = Image.open(tmp_png).copy()
-            finally:
-                if os.path.exists(tmp_png):
-                    os.unlink(tmp_png)
-
-        if img.size[0] != size_px or img.size[1] != size_px:
-            img = img.resize((size_px, size_px), Image.Resampling.LANCZOS)
-        return img
-    finally:
-        if os.path.exists(tmp_svg):
-            os.unlink(tmp_svg)
+    if img.size[0] != size_px or img.size[1] != size_px:
+        img = img.resize((size_px, size_px), Image.Resampling.LANCZOS)
+    return img
 
 
 def _pil_to_photoimage(img: Image.Image):
@@ -103,6 +109,12 @@ def _pil_to_photoimage(img: Image.Image):
     return ImageTk.PhotoImage(image=img)
 
 
+def _cache_put(key, photo):
+    _CACHE[key] = photo
+    if len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+
+
 def get_weather_icon(name: str, size: int = 32, color: str = "#ffffff"):
     """
     Return a Tkinter PhotoImage for a weather icon.
@@ -112,6 +124,7 @@ def get_weather_icon(name: str, size: int = 32, color: str = "#ffffff"):
     """
     key = ("weather", str(name).lower(), size, color)
     if key in _CACHE:
+        _CACHE.move_to_end(key)
         return _CACHE[key]
 
     base = WEATHER_ICON_TO_SVG.get(str(name).lower()) or WEATHER_ICON_TO_SVG.get(
@@ -125,7 +138,7 @@ def get_weather_icon(name: str, size: int = 32, color: str = "#ffffff"):
 
     img = _render_svg_to_pil(svg_path, color, size)
     photo = _pil_to_photoimage(img)
-    _CACHE[key] = photo
+    _cache_put(key, photo)
     return photo
 
 
@@ -135,6 +148,7 @@ def get_detail_icon(icon_type: str, size: int = 20, color: str = "#ffffff"):
     """
     key = ("detail", str(icon_type).lower(), size, color)
     if key in _CACHE:
+        _CACHE.move_to_end(key)
         return _CACHE[key]
 
     base = DETAIL_ICON_TO_SVG.get(str(icon_type).lower(), "sun")
@@ -144,5 +158,5 @@ def get_detail_icon(icon_type: str, size: int = 20, color: str = "#ffffff"):
 
     img = _render_svg_to_pil(svg_path, color, size)
     photo = _pil_to_photoimage(img)
-    _CACHE[key] = photo
+    _cache_put(key, photo)
     return photo
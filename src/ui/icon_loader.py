@@ -1,15 +1,19 @@
 """
 Icon loader utility for loading and caching Lucide icons as PNG images.
 """
+import re
 import tkinter as tk
+from collections import OrderedDict
 from pathlib import Path
-from functools import lru_cache
+
+from .theme import WEATHER_ICONS_FAST
 
 # Path to icons directory
 ICONS_DIR = Path(__file__).parent.parent.parent / 'icons'
 
-# Cache for loaded images
-_image_cache = {}
+# LRU cache for loaded images (least recently used entries are evicted)
+_image_cache = OrderedDict()
+_IMAGE_CACHE_MAX = 64
 
 def load_icon(icon_name, size=None):
     """
@@ -24,6 +28,7 @@ def load_icon(icon_name, size=None):
     """
     cache_key = (icon_name, size)
     if cache_key in _image_cache:
+        _image_cache.move_to_end(cache_key)
         return _image_cache[cache_key]
     
     icon_path = ICONS_DIR / f"{icon_name}.png"
@@ -60,6 +65,8 @@ def load_icon(icon_name, size=None):
         
         # Cache the image (keep reference to prevent garbage collection)
         _image_cache[cache_key] = image
+        if len(_image_cache) > _IMAGE_CACHE_MAX:
+            _image_cache.popitem(last=False)
         return image
     except Exception as e:
         print(f"Error loading icon {icon_name} from {icon_path}: {e}")
@@ -67,6 +74,33 @@ def load_icon(icon_name, size=None):
         traceback.print_exc()
         return None
 
+# Keyword groups for free-form conditions, in priority order: the first
+# group (by this order, not by position in the string) that matches wins
+_CONDITION_KEYWORDS = (
+    ('sun', ('clear', 'sunny', 'sun')),
+    ('rain', ('rain',)),
+    ('snow', ('snow',)),
+    ('thunderstorm', ('thunder', 'lightning')),
+    ('drizzle', ('drizzle',)),
+    ('fog', ('mist', 'fog', 'haze')),
+    ('cloud', ('cloud',)),
+)
+_CONDITION_RE = re.compile('|'.join(
+    f"(?P<{icon}>{'|'.join(map(re.escape, words))})" for icon, words in _CONDITION_KEYWORDS
+))
+
+
+def _match_condition(condition):
+    """Keyword match for free-form condition strings not in WEATHER_ICONS_FAST."""
+    found = {m.lastgroup for m in _CONDITION_RE.finditer(condition.lower())}
+    if 'drizzle' in found:
+        found.discard('rain')  # "rain" alone means rain, with "drizzle" it means drizzle
+    for icon, _ in _CONDITION_KEYWORDS:
+        if icon in found:
+            return icon
+    return 'default'
+
+
 def get_icon_for_condition(condition, size=None):
     """
     Get the appropriate icon for a weather condition.
@@ -78,24 +112,7 @@ def get_icon_for_condition(condition, size=None):
     Returns:
         tk.PhotoImage: The icon image
     """
-    condition_lower = condition.lower()
-    
-    # Map weather conditions to icon names
-    if 'clear' in condition_lower or 'sunny' in condition_lower or 'sun' in condition_lower:
-        icon_name = 'sun'
-    elif 'rain' in condition_lower and 'drizzle' not in condition_lower:
-        icon_name = 'rain'
-    elif 'snow' in condition_lower:
-        icon_name = 'snow'
-    elif 'thunder' in condition_lower or 'lightning' in condition_lower:
-        icon_name = 'thunderstorm'
-    elif 'drizzle' in condition_lower:
-        icon_name = 'drizzle'
-    elif 'mist' in condition_lower or 'fog' in condition_lower or 'haze' in condition_lower:
-        icon_name = 'fog'
-    elif 'cloud' in condition_lower:
-        icon_name = 'cloud'
-    else:
-        icon_name = 'default'
-    
+    icon_name = (WEATHER_ICONS_FAST.get(condition)
+                 or WEATHER_ICONS_FAST.get(condition.lower())
+                 or _match_condition(condition))
     return load_icon(icon_name, size)
@@ -3,26 +3,40 @@ Main content area: current weather, details, hourly and 15-day forecast.
 """
 from datetime import datetime
 import tkinter as tk
+from tkinter import ttk
 from types import SimpleNamespace
 
 from .widgets import (
-    create_rounded_rect,
+    CARD_WIDTH,
+    CARD_HEIGHT,
     create_rounded_button,
     create_hourly_card,
     create_daily_card,
 )
 from .icon_loader import load_icon
-from .theme import DETAIL_ICONS
+from .theme import DETAIL_ICONS, FONTS, HOUR_LABELS
+
+# Spacing around forecast cards inside a strip
+_CARD_PADX = 6
+_CARD_PADY = 5
+# Horizontal space per card; drives both the layout and the scroll step
+_CARD_SLOT = CARD_WIDTH + 2 * _CARD_PADX
+# Cards built before the strip knows its width
+_MIN_POOL = 8
+# Entry of a card that has not been painted yet (never equal to a real entry)
+_UNPAINTED = object()
 
 
 def build_main_content(parent, colors, *,
                        scroll_hourly_left, scroll_hourly_right,
-                       scroll_daily_left, scroll_daily_right):
+                       scroll_daily_left, scroll_daily_right, paint_card):
     """
     Build the main content area and return a namespace with widget references.
 
+    paint_card(card, entry) fills one forecast card; see _build_forecast_strip.
+
     Returns an object with: city_label, temp_label, description_label, detail_cards,
-    hourly_canvas, hourly_cards, hourly_card_width, daily_canvas, daily_cards, daily_card_width.
+    hourly_canvas, hourly_strip, hourly_card_width, daily_canvas, daily_strip, daily_card_width.
     """
     main = tk.Frame(parent, bg=colors['bg_dark'])
     main.grid(row=0, column=1, sticky='nsew', padx=(0, 15), pady=(30, 15))
@@ -35,19 +49,19 @@ def build_main_content(parent, colors, *,
     current.grid(row=0, column=0, sticky='ew', pady=(0, 20))
 
     city_label = tk.Label(
-        current, text="Loading", font=('Arial', 22, 'bold'),
+        current, text="Loading", font=FONTS['city'],
         bg=colors['bg_dark'], fg=colors['text_primary']
     )
     city_label.pack(pady=(0, 10))
 
     temp_label = tk.Label(
-        current, text="Loading", font=('Arial', 48, 'bold'),
+        current, text="Loading", font=FONTS['temp'],
         bg=colors['bg_dark'], fg=colors['text_primary']
     )
     temp_label.pack()
 
     description_label = tk.Label(
-        current, text="Loading", font=('Arial', 20),
+        current, text="Loading", font=FONTS['description'],
         bg=colors['bg_dark'], fg=colors['text_secondary']
     )
     description_label.pack()
@@ -56,58 +70,39 @@ def build_main_content(parent, colors, *,
     details_frame = tk.Frame(main, bg=colors['bg_dark'])
     details_frame.grid(row=1, column=0, sticky='ew', pady=(0, 20))
 
-    detail_cards = []
-    for title, icon_name, default_value in [
-        ("Sunrise", "sunrise", "Loading"),
-        ("Sunset", "sunset", "Loading"),
-        ("Visibility", "visibility", "Loading"),
-        ("UV Index", "uv", "Loading"),
-    ]:
-        card = tk.Frame(details_frame, bg=colors['card_bg'])
-        card.pack(side='left', fill='both', expand=True, padx=5)
-
-        header = tk.Frame(card, bg=colors['card_bg'])
-        header.pack(fill='x', pady=(15, 5))
-        
-        # Load icon as PhotoImage
-        icon_img = load_icon(icon_name, size=(20, 20))
-        icon_label = tk.Label(header, bg=colors['card_bg'])
-        if icon_img:
-            icon_label.config(image=icon_img)
-            icon_label.image = icon_img  # Keep reference
-        icon_label.pack(side='left', padx=(15, 5))
-        
-        title_label = tk.Label(header, text=title, font=('Arial', 10), bg=colors['card_bg'], fg=colors['text_secondary'])
-        title_label.pack(side='left')
-
-        value_label = tk.Label(
-            card, text=default_value, font=('Arial', 12, 'bold'),
-            bg=colors['card_bg'], fg=colors['text_primary']
-        )
-        value_label.pack(pady=(2, 15), padx=15, anchor='w')
-        card.value_label = value_label
-        detail_cards.append(card)
+    _configure_detail_styles(parent, colors)
+    detail_cards = [
+        _create_detail_card(details_frame, title, icon_name)
+        for title, icon_name in [
+            ("Sunrise", "sunrise"),
+            ("Sunset", "sunset"),
+            ("Visibility", "visibility"),
+            ("UV Index", "uv"),
+        ]
+    ]
 
     # --- Hourly forecast ---
-    hourly_card_width = 96
-    hourly_canvas, hourly_cards = _build_forecast_strip(
+    hourly_card_width = _CARD_SLOT
+    # Placeholder labels only; cards are built lazily, so read the clock once here
+    current_hour = datetime.now().hour
+    hourly_strip = _build_forecast_strip(
         main, colors, row=2, title="Hourly Forecast",
         scroll_left=scroll_hourly_left, scroll_right=scroll_hourly_right,
-        card_width=hourly_card_width,
-        card_builder=lambda f, i: create_hourly_card(
-            f, f"{(datetime.now().hour + i) % 24:02d}:00", "default", "--°", colors
+        card_builder=lambda c, x, y, i: create_hourly_card(
+            c, x, y, HOUR_LABELS[(current_hour + i) % 24], "default", "--°", colors
         ),
+        paint_card=paint_card,
         num_cards=24,
     )
 
     # --- 15-day forecast (same strip layout as hourly) ---
-    daily_card_width = 96
-    daily_canvas, daily_cards = _build_forecast_strip(
+    daily_card_width = _CARD_SLOT
+    daily_strip = _build_forecast_strip(
         main, colors, row=3, title="15 Day Forecast",
         pady=(15, 0),
         scroll_left=scroll_daily_left, scroll_right=scroll_daily_right,
-        card_width=daily_card_width,
-        card_builder=lambda f, i: create_daily_card(f, "---", "default", "--°/--°", colors),
+        card_builder=lambda c, x, y, i: create_daily_card(c, x, y, "---", "default", "--°/--°", colors),
+        paint_card=paint_card,
         num_cards=15,
     )
 
@@ -116,46 +111,70 @@ def build_main_content(parent, colors, *,
         temp_label=temp_label,
         description_label=description_label,
         detail_cards=detail_cards,
-        hourly_canvas=hourly_canvas,
-        hourly_cards=hourly_cards,
+        hourly_canvas=hourly_strip.canvas,
+        hourly_strip=hourly_strip,
         hourly_card_width=hourly_card_width,
-        daily_canvas=daily_canvas,
-        daily_cards=daily_cards,
+        daily_canvas=daily_strip.canvas,
+        daily_strip=daily_strip,
         daily_card_width=daily_card_width,
     )
 
 
-def _build_forecast_strip(parent, colors, *, row, title, scroll_left, scroll_right,
-                          card_width, card_builder, num_cards, pady=(0, 0)):
-    """Build a forecast strip (hourly or daily) with canvas, cards, and nav buttons."""
-    forecast_canvas = tk.Canvas(parent, bg=colors['bg_dark'], highlightthickness=0)
-    forecast_canvas.grid(row=row, column=0, sticky='nsew', pady=pady)
+def _configure_detail_styles(parent, colors):
+    """Register the ttk styles shared by all detail cards, once per build."""
+    style = ttk.Style(parent)
+    style.configure('Detail.TFrame', background=colors['card_bg'])
+    style.configure(
+        'DetailTitle.TLabel', font=FONTS['detail_title'],
+        background=colors['card_bg'], foreground=colors['text_secondary']
+    )
+    style.configure(
+        'DetailValue.TLabel', font=FONTS['detail_value'],
+        background=colors['card_bg'], foreground=colors['text_primary']
+    )
 
-    forecast_container = tk.Frame(forecast_canvas, bg=colors['bg_dark'])
 
-    def draw_bg(event=None):
-        forecast_canvas.delete("forecast_bg")
-        w, h = forecast_canvas.winfo_width(), forecast_canvas.winfo_height()
-        if w > 1 and h > 1:
-            create_rounded_rect(forecast_canvas, 0, 0, w, h, 10, fill=colors['bg_medium'], outline=colors['bg_medium'])
+def _create_detail_card(parent, title, icon_name):
+    """
+    Build one weather detail card (icon and title header over a value).
 
-    forecast_canvas.bind('<Configure>', draw_bg)
-    forecast_window = forecast_canvas.create_window(0, 0, window=forecast_container, anchor='nw')
+    Returns:
+        ttk.Frame: The card, with value_label showing "Loading" until data arrives
+    """
+    card = ttk.Frame(parent, style='Detail.TFrame')
+    card.pack(side='left', fill='both', expand=True, padx=5)
+
+    # Icon and title share one label
+    icon_img = load_icon(icon_name, size=(20, 20))
+    header = ttk.Label(card, image=icon_img or '', text=f"  {title}", compound='left', style='DetailTitle.TLabel')
+    header.image = icon_img  # Keep reference
+    header.pack(anchor='w', padx=15, pady=(15, 5))
+
+    value_label = ttk.Label(card, text="Loading", style='DetailValue.TLabel')
+    value_label.pack(pady=(2, 15), padx=15, anchor='w')
+    card.value_label = value_label
+    return card
 
-    def update_size(event=None):
-        w, h = forecast_canvas.winfo_width(), forecast_canvas.winfo_height()
-        if w > 1 and h > 1:
-            forecast_container.configure(width=w, height=h)
-            forecast_canvas.itemconfig(forecast_window, width=w, height=h)
-            draw_bg()
 
-    forecast_canvas.bind('<Configure>', update_size)
-    forecast_container.bind('<Configure>', lambda e: forecast_canvas.configure(scrollregion=forecast_canvas.bbox("all")))
+def _build_forecast_strip(parent, colors, *, row, title, scroll_left, scroll_right,
+                          card_builder, paint_card, num_cards, pady=(0, 0)):
+    """
+    Build a forecast strip (hourly or daily) with canvas, cards, and nav buttons.
+
+    Cards are drawn as items straight on the strip canvas (see widgets.create_hourly_card).
+
+    Returns an object with: canvas, cards (the pooled card handles), num_cards, and
+    render(entries), which calls paint_card(card, entry) for each visible card
+    whose entry changed since it was last painted.
+    """
+    # Plain grid-managed frame: the strip itself is the only thing that scrolls
+    forecast_container = tk.Frame(parent, bg=colors['bg_dark'])
+    forecast_container.grid(row=row, column=0, sticky='nsew', pady=pady)
 
     # Title and nav
     title_frame = tk.Frame(forecast_container, bg=colors['bg_dark'])
     title_frame.pack(fill='x', pady=(0, 15))
-    tk.Label(title_frame, text=title, font=('Arial', 18, 'bold'), bg=colors['bg_dark'], fg=colors['text_primary'], anchor='w').pack(side='left')
+    tk.Label(title_frame, text=title, font=FONTS['section_title'], bg=colors['bg_dark'], fg=colors['text_primary'], anchor='w').pack(side='left')
 
     nav_frame = tk.Frame(title_frame, bg=colors['bg_dark'])
     nav_frame.pack(side='right')
@@ -168,25 +187,71 @@ def _build_forecast_strip(parent, colors, *, row, title, scroll_left, scroll_rig
     strip_canvas = tk.Canvas(forecast_container, bg=colors['bg_medium'], highlightthickness=0, height=240)
     strip_canvas.pack(fill='x', expand=False, pady=(0, 15))
 
-    strip_frame = tk.Frame(strip_canvas, bg=colors['bg_medium'])
-    strip_canvas.create_window((0, 0), window=strip_frame, anchor='nw')
-
-    def update_scroll(event=None):
-        strip_canvas.configure(scrollregion=strip_canvas.bbox("all"))
-
-    strip_frame.bind("<Configure>", update_scroll)
-
-    def scroll_x(event):
-        strip_canvas.xview_scroll(int(-1 * (event.delta / 120)), "units")
-
-    strip_canvas.bind("<Enter>", lambda e: strip_canvas.bind_all("<MouseWheel>", scroll_x))
-    strip_canvas.bind("<Leave>", lambda e: strip_canvas.unbind_all("<MouseWheel>"))
-
+    # Only enough cards to cover the viewport are built, starting at the first render; they
+    # are moved and repainted as the strip scrolls, with index i drawn by cards[i % len(cards)]
+    slot = _CARD_SLOT
+    content_width = num_cards * slot
+    # One scroll "unit" (mouse wheel step) is one card
+    strip_canvas.configure(scrollregion=(0, 0, content_width, CARD_HEIGHT + 2 * _CARD_PADY),
+                           xscrollincrement=slot)
+    strip_canvas._content_width = content_width
     cards = []
-    for i in range(num_cards):
-        card = card_builder(strip_frame, i)
-        card.pack(side='left', padx=6, pady=5)
-        cards.append(card)
+    state = {'entries': None}
+
+    def _paint(card):
+        # Skipped when the card already shows this exact entry
+        entries = state['entries']
+        if entries is not None and card._index < len(entries):
+            entry = entries[card._index]
+            if entry != card._entry:
+                card._entry = entry
+                paint_card(card, entry)
+
+    def _relayout(*_):
+        n = len(cards)
+        first = max(0, min(int(strip_canvas.canvasx(0) // slot), num_cards - n))
+        for index in range(first, first + n):
+            card = cards[index % n]
+            if card._index != index:
+                card._index = index
+                card.move_to(_CARD_PADX + index * slot)
+                _paint(card)
+
+    def _ensure_pool(event=None):
+        # No cards until the first render, so startup lays out an empty strip
+        if state['entries'] is None:
+            return
+        wanted = min(num_cards, max(_MIN_POOL, strip_canvas.winfo_width() // slot + 2))
+        if len(cards) >= wanted:
+            return
+        while len(cards) < wanted:
+            card = card_builder(strip_canvas, _CARD_PADX, _CARD_PADY, len(cards))
+            card._index = None
+            card._entry = _UNPAINTED
+            cards.append(card)
+        # Pool size changed, so every card's index mapping did too
+        for card in cards:
+            card._index = None
+        _relayout()
+
+    def render(entries):
+        """Show entries (one per forecast slot); only pooled cards are touched."""
+        first_render = state['entries'] is None
+        state['entries'] = entries
+        if first_render:
+            _ensure_pool()
+        for card in cards:
+            _paint(card)
+
+    strip_canvas.configure(xscrollcommand=_relayout)
+    strip_canvas.bind('<Configure>', _ensure_pool)
+    # Drag to scroll; scan_dragto stays inside the scrollregion and reports through _relayout
+    strip_canvas.bind('<ButtonPress-1>', lambda e: strip_canvas.scan_mark(e.x, 0))
+    strip_canvas.bind('<B1-Motion>', lambda e: strip_canvas.scan_dragto(e.x, 0, gain=1))
 
-    update_scroll()
-    return strip_canvas, cards
+    return SimpleNamespace(
+        canvas=strip_canvas,
+        cards=cards,
+        num_cards=num_cards,
+        render=render,
+    )
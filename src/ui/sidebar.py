@@ -2,18 +2,45 @@
 Sidebar UI: search, city list, and temperature unit switcher.
 """
 import tkinter as tk
+from tkinter import ttk
 from types import SimpleNamespace
 
+from .theme import FONTS
 from .widgets import create_rounded_rect
 
+# Shown in the empty search box; the app tracks whether it is showing
+SEARCH_PLACEHOLDER = "  🔍 Search city..."
+
+# City buttons built before the first paint; the rest follow shortly after
+_EAGER_CITY_BUTTONS = 8
+_DEFERRED_CITY_DELAY_MS = 50
+
+
+def _configure_styles(parent, colors):
+    """Register the ttk styles for the city list once, so each widget only names a style."""
+    style = ttk.Style(parent)
+    style.configure(
+        'SidebarCity.TLabel', font=FONTS['sidebar_text'], background=colors['card_bg'],
+        foreground=colors['text_primary'], relief='flat', anchor='w', padding=(15, 10)
+    )
+    style.configure(
+        'SidebarTemp.TLabel', font=FONTS['sidebar_small'], background=colors['card_bg'],
+        foreground=colors['text_secondary']
+    )
+
 
 def build_sidebar(parent, colors, cities, *,
                   on_city_click, on_search, on_unit_change, on_switcher_hover,
-                  on_search_focus_in, on_search_focus_out):
+                  on_search_focus_in, on_search_focus_out, on_cities_ready=None):
     """
     Build the sidebar and return a namespace with widget references.
 
-    Returns an object with: sidebar_search, city_buttons, unit_c_button, unit_f_button.
+    Only the first _EAGER_CITY_BUTTONS city buttons are built right away; the
+    rest are added from an after() callback, which then calls on_cities_ready()
+    so their temperature labels can be filled in.
+
+    Returns an object with: sidebar_search, city_buttons, city_temp_labels
+    ({city.lower(): temp_label}, filled as buttons are built), unit_c_button, unit_f_button.
     """
     sidebar_canvas = tk.Canvas(
         parent, bg=colors['bg_dark'],
@@ -34,7 +61,6 @@ def build_sidebar(parent, colors, cities, *,
                 fill=colors['sidebar_bg'], outline=colors['sidebar_bg']
             )
 
-    sidebar_canvas.bind('<Configure>', draw_sidebar_bg)
     sidebar_window = sidebar_canvas.create_window(0, 0, window=sidebar, anchor='nw')
 
     def update_sidebar_size(event=None):
@@ -43,22 +69,23 @@ def build_sidebar(parent, colors, cities, *,
         if w > 1 and h > 1:
             sidebar.configure(width=w, height=h)
             sidebar_canvas.itemconfig(sidebar_window, width=w, height=h)
+            # The sidebar always fills the canvas, so its size is the scrollregion
+            sidebar_canvas.configure(scrollregion=(0, 0, w, h))
             draw_sidebar_bg()
 
     sidebar_canvas.bind('<Configure>', update_sidebar_size)
-    sidebar.bind('<Configure>', lambda e: sidebar_canvas.configure(scrollregion=sidebar_canvas.bbox("all")))
 
     # Search
     search_frame = tk.Frame(sidebar, bg=colors['sidebar_bg'])
     search_frame.pack(fill='x', padx=10, pady=(10, 20))
 
     sidebar_search = tk.Entry(
-        search_frame, font=('Arial', 11), bg=colors['bg_light'],
+        search_frame, font=FONTS['sidebar_text'], bg=colors['bg_light'],
         fg=colors['text_primary'], insertbackground='white',
         relief='flat', bd=0
     )
     sidebar_search.pack(fill='x', ipady=8, padx=5)
-    sidebar_search.insert(0, "  🔍 Search city...")
+    sidebar_search.insert(0, SEARCH_PLACEHOLDER)
     sidebar_search.bind('<Return>', lambda e: on_search())
     sidebar_search.bind('<FocusIn>', on_search_focus_in)
     sidebar_search.bind('<FocusOut>', on_search_focus_out)
@@ -67,32 +94,43 @@ def build_sidebar(parent, colors, cities, *,
     list_frame = tk.Frame(sidebar, bg=colors['sidebar_bg'])
     list_frame.pack(fill='both', expand=True, padx=10, pady=5)
 
+    _configure_styles(parent, colors)
     city_buttons = []
-    for city in cities:
+    city_temp_labels = {}
+
+    def add_city_button(city):
         btn_frame = tk.Frame(list_frame, bg=colors['card_bg'], bd=0)
         btn_frame.pack(fill='x', pady=3)
 
-        btn = tk.Label(
-            btn_frame, text=city, font=('Arial', 11), bg=colors['card_bg'],
-            fg=colors['text_primary'], relief='flat', anchor='w',
-            padx=15, pady=10, cursor='hand2'
-        )
+        btn = ttk.Label(btn_frame, text=city, style='SidebarCity.TLabel', cursor='hand2')
         btn.pack(fill='both')
         btn.bind('<Button-1>', lambda e, c=city: on_city_click(c))
 
-        temp_label = tk.Label(
-            btn_frame, text="--°", font=('Arial', 10),
-            bg=colors['card_bg'], fg=colors['text_secondary']
-        )
+        temp_label = ttk.Label(btn_frame, text="--°", style='SidebarTemp.TLabel')
         temp_label.place(relx=0.85, rely=0.5, anchor='center')
         city_buttons.append((btn_frame, btn, temp_label, city))
+        city_temp_labels[city.lower()] = temp_label
+
+    cities = list(cities)
+    for city in cities[:_EAGER_CITY_BUTTONS]:
+        add_city_button(city)
+
+    deferred = cities[_EAGER_CITY_BUTTONS:]
+    if deferred:
+        def add_deferred_buttons():
+            for city in deferred:
+                add_city_button(city)
+            if on_cities_ready:
+                on_cities_ready()
+
+        parent.after(_DEFERRED_CITY_DELAY_MS, add_deferred_buttons)
 
     # Unit switcher
     switcher_container = tk.Frame(sidebar, bg=colors['sidebar_bg'])
     switcher_container.pack(fill='x', padx=10, pady=(10, 15))
 
     switcher_label = tk.Label(
-        switcher_container, text="Temperature Unit", font=('Arial', 10),
+        switcher_container, text="Temperature Unit", font=FONTS['sidebar_small'],
         bg=colors['sidebar_bg'], fg=colors['text_secondary']
     )
     switcher_label.pack(pady=(0, 8))
@@ -101,7 +139,7 @@ def build_sidebar(parent, colors, cities, *,
     unit_switcher_frame.pack()
 
     unit_c_button = tk.Label(
-        unit_switcher_frame, text="°C", font=('Arial', 13, 'bold'),
+        unit_switcher_frame, text="°C", font=FONTS['unit_switch'],
         bg=colors['accent'], fg=colors['text_primary'],
         relief='flat', padx=20, pady=8, cursor='hand2'
     )
@@ -111,7 +149,7 @@ def build_sidebar(parent, colors, cities, *,
     unit_c_button.bind('<Leave>', lambda e: on_switcher_hover('c', False))
 
     unit_f_button = tk.Label(
-        unit_switcher_frame, text="°F", font=('Arial', 13, 'bold'),
+        unit_switcher_frame, text="°F", font=FONTS['unit_switch'],
         bg=colors['bg_light'], fg=colors['text_secondary'],
         relief='flat', padx=20, pady=8, cursor='hand2'
     )
@@ -123,6 +161,7 @@ def build_sidebar(parent, colors, cities, *,
     return SimpleNamespace(
         sidebar_search=sidebar_search,
         city_buttons=city_buttons,
+        city_temp_labels=city_temp_labels,
         unit_c_button=unit_c_button,
         unit_f_button=unit_f_button,
     )
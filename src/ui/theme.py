@@ -1,6 +1,7 @@
 """
 Theme and static configuration for the Weather App UI.
 """
+import tkinter.font as tkfont
 
 # App color palette
 COLORS = {
@@ -14,6 +15,42 @@ COLORS = {
     'card_bg': '#2d2d44',
 }
 
+# Shared font specs, so every widget of a kind passes the same tuple
+# (named Tk fonts once register_fonts() has run)
+FONTS = {
+    'city': ('Arial', 22, 'bold'),
+    'temp': ('Arial', 48, 'bold'),
+    'description': ('Arial', 20),
+    'section_title': ('Arial', 18, 'bold'),
+    'detail_title': ('Arial', 10),
+    'detail_value': ('Arial', 12, 'bold'),
+    'card_header': ('Arial', 11),
+    'card_temp': ('Arial', 18, 'bold'),
+    'nav_button': ('Arial', 11, 'bold'),
+    'sidebar_text': ('Arial', 11),
+    'sidebar_small': ('Arial', 10),
+    'unit_switch': ('Arial', 13, 'bold'),
+}
+
+
+def register_fonts(root):
+    """
+    Replace the FONTS specs with named Tk fonts, created once for root.
+
+    Widgets built afterwards share one font resource per role instead of each
+    passing a spec Tk must parse. Call before building any widgets.
+
+    Args:
+        root: The Tk root window
+    """
+    for role, spec in FONTS.items():
+        if isinstance(spec, tuple):
+            family, size, *style = spec
+            FONTS[role] = tkfont.Font(
+                root, name=f"weather_{role}", family=family, size=size,
+                weight=style[0] if style else 'normal'
+            )
+
 # Weather condition to icon file mapping (PNG icons)
 WEATHER_ICONS = {
     'clear': 'sun', 'sunny': 'sun', 'clouds': 'cloud', 'cloudy': 'cloud',
@@ -22,6 +59,13 @@ WEATHER_ICONS = {
     'haze': 'fog', 'default': 'cloud',
 }
 
+# WEATHER_ICONS plus the capitalizations the APIs actually return ('Clear', 'Clouds', ...),
+# so icon lookups are a plain dict get. 'default' is left out so unknown conditions
+# still fall through to the default icon.
+WEATHER_ICONS_FAST = {k: v for k, v in WEATHER_ICONS.items() if k != 'default'}
+WEATHER_ICONS_FAST.update({k.title(): v for k, v in list(WEATHER_ICONS_FAST.items())})
+WEATHER_ICONS_FAST.update({k.capitalize(): v for k, v in list(WEATHER_ICONS_FAST.items())})
+
 # Detail card icon mapping
 DETAIL_ICONS = {
     'sunrise': 'sunrise',
@@ -35,3 +79,6 @@ GERMAN_CITIES = [
     "Zweibrücken", "Zwickau", "Berlin", "Munich", "Hamburg", "Frankfurt",
     "Cologne", "Stuttgart", "Düsseldorf",
 ]
+
+# "HH:00" label for each hour of the day, shared by the hourly strip and its placeholders
+HOUR_LABELS = tuple(f"{h:02d}:00" for h in range(24))
@@ -4,31 +4,87 @@ Main WeatherApp that composes sidebar, main content, and weather logic.
 import tkinter as tk
 from tkinter import messagebox
 from datetime import datetime
+from functools import lru_cache
 
-from .theme import COLORS, WEATHER_ICONS, GERMAN_CITIES
+from .theme import COLORS, WEATHER_ICONS, GERMAN_CITIES, HOUR_LABELS, register_fonts
 from .weather_controller import WeatherController
-from .sidebar import build_sidebar
+from .sidebar import build_sidebar, SEARCH_PLACEHOLDER
 from .main_content import build_main_content
 from .icon_loader import get_icon_for_condition, load_icon
 
+# Resolved condition icons, keyed by (condition, size)
+_ICON_CACHE = {}
+
+
+@lru_cache(maxsize=256)
+def _temp_str(degrees, symbol):
+    """Display string for a whole-degree temperature; the few distinct values repeat constantly."""
+    return f"{degrees}{symbol}"
+
+
+# Per-unit Celsius conversions and display formatters, picked once per unit
+# instead of branching on the unit for every value
+_CONVERTERS = {
+    'celsius': lambda t: t,
+    'fahrenheit': lambda t: t * 9 / 5 + 32,
+}
+_UNIT_SYMBOLS = {'celsius': '°C', 'fahrenheit': '°F'}
+_TEMP_FORMATTERS = {
+    'celsius': lambda t: _temp_str(round(t), '°C'),
+    'fahrenheit': lambda t: _temp_str(round(t * 9 / 5 + 32), '°F'),
+}
+
+# Quiet period after a city request before it is fetched; a newer request
+# within it replaces the pending one
+_FETCH_DEBOUNCE_MS = 150
+
+# Per-hour lookup table for the synthesized hourly forecast
+_IS_NIGHT_HOUR = tuple(h >= 20 or h < 6 for h in range(24))
+# Temperature offsets from the current temperature, repeating every 8 hours
+_HOURLY_OFFSETS = tuple(((i % 8) - 3.5) * 1.5 for i in range(8))
+
 
 class WeatherApp:
     def __init__(self, root):
         self.root = root
-        self.controller = WeatherController()
+        self.controller = WeatherController(root)
         self.temp_unit = 'celsius'
+        self._fmt_temp = _TEMP_FORMATTERS[self.temp_unit]
         self.current_weather_data = None
+        # Display strings for both units, rebuilt per dataset (see _build_formatted)
+        self._formatted = None
+        # True once real data has been shown (labels built reading "Loading", no forecast cards yet)
+        self._is_dirty = False
+        # ProcessedWeather currently on screen; cleared when "Loading" replaces it
+        self._last_rendered = None
+        # Celsius temps of prefetched sidebar cities, re-formatted on unit toggles
+        self._sidebar_temps = {}
         self.colors = COLORS
         self.weather_icons = WEATHER_ICONS
+        # Options for a forecast card's icon label while loading (see _paint_card)
+        self._loading_icon_cfg = {'image': '', 'text': 'Loading', 'fg': self.colors['text_secondary']}
+        # Widget option changes waiting for the next idle flush (see _queue)
+        self._pending_updates = {}
+        self._flush_job = None
+        # Debounced city fetch waiting to run (see load_weather_for_city)
+        self._pending_fetch = None
+        # True while the search box shows SEARCH_PLACEHOLDER instead of user input
+        self._search_has_placeholder = True
+        # Option values last applied per widget, so unchanged ones are never re-sent to Tk
+        self._shown = {}
 
         self.controller.register_callback('on_success', self.on_weather_success)
         self.controller.register_callback('on_error', self.on_weather_error)
         self.controller.register_callback('on_loading', self.on_loading)
+        self.controller.register_callback('on_prefetched', self.on_weather_prefetched)
 
         self.setup_window()
         self.create_widgets()
         self.update_unit_switcher_ui()
-        self.load_weather_for_city("Zwickau")
+        # One wheel binding for the app lifetime; _global_wheel routes it to the strip under the pointer
+        self.root.bind_all("<MouseWheel>", self._global_wheel)
+        # Let the window map and paint before the first fetch
+        self.root.after_idle(self._load_initial_weather)
 
     def setup_window(self):
         self.root.title("Weather Forecast App")
@@ -38,6 +94,7 @@ class WeatherApp:
         self.root.columnconfigure(0, weight=0)
         self.root.columnconfigure(1, weight=1)
         self.root.rowconfigure(0, weight=1)
+        register_fonts(self.root)
 
         self.root.update_idletasks()
         x = (self.root.winfo_screenwidth() // 2) - 700
@@ -53,9 +110,11 @@ class WeatherApp:
             on_switcher_hover=self.on_switcher_hover,
             on_search_focus_in=self.on_search_focus_in,
             on_search_focus_out=self.on_search_focus_out,
+            on_cities_ready=self._update_sidebar_temps,
         )
         self.sidebar_search = side.sidebar_search
         self.city_buttons = side.city_buttons
+        self._city_temp_labels = side.city_temp_labels
         self.unit_c_button = side.unit_c_button
         self.unit_f_button = side.unit_f_button
 
@@ -65,25 +124,39 @@ class WeatherApp:
             scroll_hourly_right=self.scroll_hourly_right,
             scroll_daily_left=self.scroll_daily_left,
             scroll_daily_right=self.scroll_daily_right,
+            paint_card=self._paint_card,
         )
         self.city_label = main.city_label
         self.temp_label = main.temp_label
         self.description_label = main.description_label
         self.detail_cards = main.detail_cards
         self.hourly_canvas = main.hourly_canvas
-        self.hourly_cards = main.hourly_cards
+        self.hourly_strip = main.hourly_strip
         self.hourly_card_width = main.hourly_card_width
         self.daily_canvas = main.daily_canvas
-        self.daily_cards = main.daily_cards
+        self.daily_strip = main.daily_strip
         self.daily_card_width = main.daily_card_width
 
     # --- Actions ---
 
+    def _load_initial_weather(self, city="Zwickau"):
+        # Not debounced: the visible city must reach the loop ahead of the prefetch
+        self.controller.fetch_weather(city)
+        # Fill the other sidebar temperatures in one throttled concurrent batch
+        self.controller.fetch_many([c for c in GERMAN_CITIES if c.lower() != city.lower()])
+
     def load_weather_for_city(self, city):
+        # Rapid clicks across cities coalesce into one fetch for the last one
+        if self._pending_fetch is not None:
+            self.root.after_cancel(self._pending_fetch)
+        self._pending_fetch = self.root.after(_FETCH_DEBOUNCE_MS, self._run_pending_fetch, city)
+
+    def _run_pending_fetch(self, city):
+        self._pending_fetch = None
         self.controller.fetch_weather(city)
 
     def search_city(self):
-        term = self.sidebar_search.get().replace("  🔍 Search city...", "").strip()
+        term = '' if self._search_has_placeholder else self.sidebar_search.get().strip()
         if term:
             self.load_weather_for_city(term)
 
@@ -91,9 +164,11 @@ class WeatherApp:
         if unit == self.temp_unit:
             return
         self.temp_unit = unit
+        self._fmt_temp = _TEMP_FORMATTERS[unit]
         self.update_unit_switcher_ui()
         if self.current_weather_data:
-            self.update_temperature_displays(self.current_weather_data)
+            self.update_temperature_displays()
+        self._update_sidebar_temps()
 
     def on_switcher_hover(self, unit, is_entering):
         if unit == 'c':
@@ -118,22 +193,43 @@ class WeatherApp:
     # --- Weather controller callbacks ---
 
     def on_weather_success(self, data):
+        # Field-by-field dataclass equality, so any changed value is redrawn
+        if data == self._last_rendered:
+            return
+        self._last_rendered = data
         self.current_weather_data = data
-        self.city_label.config(text=data['city'])
-        icon_img = self.get_weather_icon(data['main'], size=(32, 32))
+        self._sidebar_temps[data.city.lower()] = data.temp_celsius
+        self._is_dirty = True
+        self._formatted = self._build_formatted(data)
+        self._queue(self.city_label, text=data.city)
+        icon_img = self.get_weather_icon(data.main, size=(32, 32))
         if icon_img:
             # Clear any existing text/image and set new image with text
-            self.description_label.config(image=icon_img, text=f"  {data['description']}", compound='left')
+            self._queue(self.description_label, image=icon_img, text=f"  {data.description}", compound='left')
             self.description_label.image = icon_img  # Keep reference
         else:
-            self.description_label.config(image='', text=data['description'])
-
-        self.detail_cards[0].value_label.config(text=data.get('sunrise', 'N/A'))
-        self.detail_cards[1].value_label.config(text=data.get('sunset', 'N/A'))
-        vis = data.get('visibility')
-        self.detail_cards[2].value_label.config(text=f"{vis:.1f} km" if vis is not None else "N/A")
-        self.detail_cards[3].value_label.config(text=data.get('uv_index', 'N/A'))
-        self.update_temperature_displays(data)
+            self._queue(self.description_label, image='', text=data.description)
+
+        vis = data.visibility
+        detail_values = [
+            data.sunrise,
+            data.sunset,
+            f"{vis:.1f} km" if vis is not None else "N/A",
+            data.uv_index,
+        ]
+        for card, value in zip(self.detail_cards, detail_values):
+            self._queue(card.value_label, text=value)
+        self.update_temperature_displays()
+
+    def on_weather_prefetched(self, city, data):
+        self._sidebar_temps[city.lower()] = data.temp_celsius
+        self._update_sidebar_temps()
+
+    def _update_sidebar_temps(self):
+        for city, temp_c in self._sidebar_temps.items():
+            temp_label = self._city_temp_labels.get(city)
+            if temp_label:
+                self._queue(temp_label, text=self._fmt_temp(temp_c))
 
     def on_weather_error(self, title, message):
         messagebox.showerror(title, message)
@@ -141,41 +237,73 @@ class WeatherApp:
     def on_loading(self, is_loading, message):
         self.root.config(cursor="wait" if is_loading else "")
         if is_loading:
-            self._show_loading_state()
-            self.root.update()
+            # Until data has been shown, the labels still read "Loading" and the
+            # forecast strips have no cards yet, so there is nothing to reset
+            if self._is_dirty:
+                self._show_loading_state()
+            # Flush queued updates and repaint without re-entering the event loop
+            self.root.update_idletasks()
 
     def _show_loading_state(self):
         """Show 'Loading' in all main content areas while fetching."""
-        c = self.colors
-        self.city_label.config(text="Loading")
-        self.temp_label.config(text="Loading")
-        self.description_label.config(image='', text="Loading")
-        if hasattr(self.description_label, 'image'):
-            self.description_label.image = None
+        self._last_rendered = None
+        self._queue(self.city_label, text="Loading")
+        self._queue(self.temp_label, text="Loading")
+        self._queue(self.description_label, image='', text="Loading")
+        self.description_label.image = None
         for card in self.detail_cards:
-            card.value_label.config(text="Loading")
-        for card in self.hourly_cards:
-            card.time_label.config(text="Loading")
-            card.temp_label.config(text="")
-            card.icon_label.config(image='', text="Loading", fg=c['text_secondary'])
-            if hasattr(card.icon_label, 'image'):
-                card.icon_label.image = None
-        for card in self.daily_cards:
-            card.day_label.config(text="Loading")
-            card.temp_label.config(text="")
-            card.icon_label.config(image='', text="Loading", fg=c['text_secondary'])
-            if hasattr(card.icon_label, 'image'):
-                card.icon_label.image = None
+            self._queue(card.value_label, text="Loading")
+        # A None entry paints a card in its loading state (see _paint_card)
+        self.hourly_strip.render([None] * self.hourly_strip.num_cards)
+        self.daily_strip.render([None] * self.daily_strip.num_cards)
+
+    def _paint_card(self, card, entry):
+        """Fill a forecast card from a (label, temp_str, icon) entry, or show loading for None."""
+        if entry is None:
+            self._queue(card.header_label, text="Loading")
+            self._queue(card.temp_label, text="")
+            self._queue(card.icon_label, **self._loading_icon_cfg)
+            card.icon_label.image = None
+            return
+        label, temp_str, icon_img = entry
+        self._queue(card.header_label, text=label)
+        self._queue(card.temp_label, text=temp_str)
+        self._queue(card.icon_label, image=icon_img or '', text='')
+        card.icon_label.image = icon_img  # Keep reference
+
+    # --- Batched widget updates ---
+
+    def _queue(self, widget, **options):
+        """
+        Queue configure() options for widget; all queued changes are applied
+        in one pass when Tk goes idle, merging repeated updates per widget.
+        Options equal to what the widget already shows are skipped at flush time.
+        """
+        self._pending_updates.setdefault(widget, {}).update(options)
+        if self._flush_job is None:
+            self._flush_job = self.root.after_idle(self._flush_updates)
+
+    def _flush_updates(self):
+        self._flush_job = None
+        pending, self._pending_updates = self._pending_updates, {}
+        for widget, options in pending.items():
+            shown = self._shown.setdefault(widget, {})
+            changed = {k: v for k, v in options.items() if k not in shown or shown[k] != v}
+            if changed:
+                widget.configure(**changed)
+                shown.update(changed)
 
     # --- Search ---
 
     def on_search_focus_in(self, event):
-        if self.sidebar_search.get() == "  🔍 Search city...":
+        if self._search_has_placeholder:
             self.sidebar_search.delete(0, tk.END)
+            self._search_has_placeholder = False
 
     def on_search_focus_out(self, event):
         if not self.sidebar_search.get():
-            self.sidebar_search.insert(0, "  🔍 Search city...")
+            self.sidebar_search.insert(0, SEARCH_PLACEHOLDER)
+            self._search_has_placeholder = True
 
     # --- Helpers ---
 
@@ -190,145 +318,139 @@ class WeatherApp:
         Returns:
             tk.PhotoImage: The icon image
         """
-        return get_icon_for_condition(condition, size=size) or load_icon('default', size=size)
+        key = (condition, size)
+        icon = _ICON_CACHE.get(key)
+        if icon is None:
+            icon = get_icon_for_condition(condition, size=size) or load_icon('default', size=size)
+            if icon is not None:
+                _ICON_CACHE[key] = icon
+        return icon
+
+    def _build_formatted(self, data):
+        """
+        Pre-format every temperature-dependent string for both units.
 
-    def update_temperature_displays(self, data):
-        if self.temp_unit == 'fahrenheit':
-            temp = self.controller.convert_temperature(data['temp_celsius'], 'fahrenheit')
-            unit_symbol = '°F'
-        else:
-            temp = data['temp_celsius']
-            unit_symbol = '°C'
+        Args:
+            data: Processed weather data (Celsius values)
 
-        self.temp_label.config(text=f"{temp:.0f}{unit_symbol}")
+        Returns:
+            dict: {'celsius': view, 'fahrenheit': view}, where each view holds
+            'temp' plus 'hourly' / 'daily' lists of (label, temp_str, icon)
+        """
+        default_icon = load_icon('default', size=(32, 32))
 
-        # Hourly
-        hourly_forecast = data.get('hourly_forecast', [])
+        # Hourly rows as (time, temp_celsius or None, icon)
+        hourly_rows = []
+        hourly_forecast = data.hourly_forecast
         if hourly_forecast:
-            for i, card in enumerate(self.hourly_cards):
+            for i in range(self.hourly_strip.num_cards):
                 if i < len(hourly_forecast):
                     item = hourly_forecast[i]
-                    temp_c = item['temperature']
-                    temp_display = self.controller.convert_temperature(temp_c, 'fahrenheit') if self.temp_unit == 'fahrenheit' else temp_c
-                    card.time_label.config(text=item['time'])
-                    card.temp_label.config(text=f"{temp_display:.0f}{unit_symbol}")
                     icon_img = self.get_weather_icon(item.get('condition', 'Unknown'), size=(32, 32))
-                    if icon_img:
-                        card.icon_label.config(image=icon_img, text='')
-                        card.icon_label.image = icon_img  # Keep reference
-                    else:
-                        card.icon_label.config(image='', text='')
+                    hourly_rows.append((item['time'], item['temperature'], icon_img))
                 else:
-                    card.time_label.config(text="--:--")
-                    card.temp_label.config(text=f"--{unit_symbol}")
-                    default_icon = load_icon('default', size=(32, 32))
-                    if default_icon:
-                        card.icon_label.config(image=default_icon)
-                        card.icon_label.image = default_icon
+                    hourly_rows.append(("--:--", None, default_icon))
         else:
-            base_temp = data['temp_celsius']
+            base_temp = data.temp_celsius
             current_hour = datetime.now().hour
-            current_condition = data.get('main', 'Unknown')
+            current_condition = data.main
             base_icon = self.get_weather_icon(current_condition, size=(32, 32))
-            for i, card in enumerate(self.hourly_cards):
-                hour = (current_hour + i) % 24
-                temp_variation = ((i % 8) - 3.5) * 1.5
-                hourly_temp_c = base_temp + temp_variation
-                hourly_temp = self.controller.convert_temperature(hourly_temp_c, 'fahrenheit') if self.temp_unit == 'fahrenheit' else hourly_temp_c
-                card.time_label.config(text=f"{hour:02d}:00")
-                card.temp_label.config(text=f"{hourly_temp:.0f}{unit_symbol}")
-                if hour >= 20 or hour < 6:
-                    # Use moon icon for night, or base icon
-                    if 'clear' in current_condition.lower() or 'sun' in current_condition.lower():
-                        hourly_icon = load_icon('sunset', size=(32, 32)) or base_icon
-                    else:
-                        hourly_icon = base_icon
-                else:
-                    hourly_icon = base_icon
-                if hourly_icon:
-                    card.icon_label.config(image=hourly_icon, text='')
-                    card.icon_label.image = hourly_icon
-                else:
-                    card.icon_label.config(image='', text='')
-
-        # Daily
-        daily_forecast = data.get('daily_forecast', [])
-        if daily_forecast:
-            for i, card in enumerate(self.daily_cards):
-                if i < len(daily_forecast):
-                    entry = daily_forecast[i]
-                    t_high, t_low = entry.get('temperature_max'), entry.get('temperature_min')
-                    if self.temp_unit == 'fahrenheit':
-                        high = self.controller.convert_temperature(t_high, 'fahrenheit') if t_high is not None else None
-                        low = self.controller.convert_temperature(t_low, 'fahrenheit') if t_low is not None else None
-                    else:
-                        high, low = t_high, t_low
-                    temp_str = f"{high:.0f}°/ {low:.0f}°" if (high is not None and low is not None) else "--°/--°"
-                    card.day_label.config(text=entry.get('day', '---'))
-                    card.temp_label.config(text=temp_str)
-                    icon_img = self.get_weather_icon(entry.get('condition', 'default'), size=(32, 32))
-                    if icon_img:
-                        card.icon_label.config(image=icon_img, text='')
-                        card.icon_label.image = icon_img  # Keep reference
-                    else:
-                        card.icon_label.config(image='', text='')
-                else:
-                    card.day_label.config(text="---")
-                    card.temp_label.config(text="--°/--°")
-                    default_icon = load_icon('default', size=(32, 32))
-                    if default_icon:
-                        card.icon_label.config(image=default_icon, text='')
-                        card.icon_label.image = default_icon
-                    else:
-                        card.icon_label.config(image='', text='')
-        else:
-            default_icon = load_icon('default', size=(32, 32))
-            for card in self.daily_cards:
-                card.day_label.config(text="---")
-                card.temp_label.config(text="--°/--°")
-                if default_icon:
-                    card.icon_label.config(image=default_icon)
-                    card.icon_label.image = default_icon
-                else:
-                    card.icon_label.config(image='', text='')
+            # Night hours of a clear day get the sunset icon; decide that once
+            cond_lower = current_condition.lower()
+            is_clearish = 'clear' in cond_lower or 'sun' in cond_lower
+            sunset_icon = load_icon('sunset', size=(32, 32)) if is_clearish else None
+            # (day icon, night icon), indexed by _IS_NIGHT_HOUR[hour]
+            icon_by_night = (base_icon, sunset_icon or base_icon)
+            hours = [(current_hour + i) % 24 for i in range(self.hourly_strip.num_cards)]
+            hourly_rows = [
+                (HOUR_LABELS[hour], base_temp + _HOURLY_OFFSETS[i % 8], icon_by_night[_IS_NIGHT_HOUR[hour]])
+                for i, hour in enumerate(hours)
+            ]
+
+        # Daily rows as (day, high, low, icon)
+        daily_rows = []
+        daily_forecast = data.daily_forecast
+        for i in range(self.daily_strip.num_cards):
+            if i < len(daily_forecast):
+                entry = daily_forecast[i]
+                icon_img = self.get_weather_icon(entry.get('condition', 'default'), size=(32, 32))
+                daily_rows.append((entry.get('day', '---'), entry.get('temperature_max'),
+                                   entry.get('temperature_min'), icon_img))
+            else:
+                daily_rows.append(("---", None, None, default_icon))
+
+        formatted = {}
+        for unit, fmt in _TEMP_FORMATTERS.items():
+            convert = _CONVERTERS[unit]
+            unit_symbol = _UNIT_SYMBOLS[unit]
+            hourly = [
+                (label, fmt(t) if t is not None else f"--{unit_symbol}", icon)
+                for label, t, icon in hourly_rows
+            ]
+            daily = [
+                (day, f"{_temp_str(round(convert(high)), '°')}/ {_temp_str(round(convert(low)), '°')}"
+                 if (high is not None and low is not None) else "--°/--°", icon)
+                for day, high, low, icon in daily_rows
+            ]
+            formatted[unit] = {
+                'temp': fmt(data.temp_celsius),
+                'hourly': hourly,
+                'daily': daily,
+            }
+        return formatted
+
+    def update_temperature_displays(self):
+        """Push the pre-formatted strings for the active unit into the widgets."""
+        view = self._formatted[self.temp_unit]
+        self._queue(self.temp_label, text=view['temp'])
+
+        self.hourly_strip.render(view['hourly'])
+        self.daily_strip.render(view['daily'])
 
         # Sidebar city temps
-        for _, _, temp_label, btn_city in self.city_buttons:
-            if btn_city.lower() == data['city'].lower():
-                temp_display = self.controller.convert_temperature(data['temp_celsius'], 'fahrenheit') if self.temp_unit == 'fahrenheit' else data['temp_celsius']
-                temp_label.config(text=f"{temp_display:.0f}{unit_symbol}")
-                break
+        temp_label = self._city_temp_labels.get(self.current_weather_data.city.lower())
+        if temp_label:
+            self._queue(temp_label, text=view['temp'])
 
     # --- Scroll ---
 
+    def _global_wheel(self, event):
+        """Scroll the forecast strip under the pointer, if any, horizontally."""
+        try:
+            widget = self.root.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            # Pointer is over a Tk-internal widget (e.g. a menu popdown)
+            return
+        strips = (self.hourly_canvas, self.daily_canvas)
+        while widget is not None and widget not in strips:
+            widget = widget.master
+        if widget is not None:
+            widget.xview_scroll(int(-1 * (event.delta / 120)), "units")
+
     def scroll_hourly_left(self):
-        bbox = self.hourly_canvas.bbox("all")
-        if bbox:
-            content_width = bbox[2] - bbox[0]
+        content_width = self.hourly_canvas._content_width
+        if content_width is not None:
             left, right = self.hourly_canvas.xview()
             scroll_fraction = self.hourly_card_width / content_width if content_width > 0 else 0.1
             self.hourly_canvas.xview_moveto(max(0.0, left - scroll_fraction))
 
     def scroll_hourly_right(self):
-        bbox = self.hourly_canvas.bbox("all")
-        if bbox:
-            content_width = bbox[2] - bbox[0]
+        content_width = self.hourly_canvas._content_width
+        if content_width is not None:
             left, right = self.hourly_canvas.xview()
             scroll_fraction = self.hourly_card_width / content_width if content_width > 0 else 0.1
             self.hourly_canvas.xview_moveto(min(1.0 - (right - left), left + scroll_fraction))
 
     def scroll_daily_left(self):
-        bbox = self.daily_canvas.bbox("all")
-        if bbox:
-            content_width = bbox[2] - bbox[0]
+        content_width = self.daily_canvas._content_width
+        if content_width is not None:
             scroll_fraction = self.daily_card_width / content_width if content_width > 0 else 0.1
             left, right = self.daily_canvas.xview()
             self.daily_canvas.xview_moveto(max(0.0, left - scroll_fraction))
 
     def scroll_daily_right(self):
-        bbox = self.daily_canvas.bbox("all")
-        if bbox:
-            content_width = bbox[2] - bbox[0]
+        content_width = self.daily_canvas._content_width
+        if content_width is not None:
             scroll_fraction = self.daily_card_width / content_width if content_width > 0 else 0.1
             left, right = self.daily_canvas.xview()
             self.daily_canvas.xview_moveto(min(1.0 - (right - left), left + scroll_fraction))
@@ -1,29 +1,126 @@
 
-import sys
+import asyncio
+import json
+import logging
+import re
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Callable
+from typing import Optional, Dict, Callable, List
 
-# Add parent directories to path to import from api folder
-current_dir = Path(__file__).parent
-src_dir = current_dir.parent
-project_root = src_dir.parent
+log = logging.getLogger(__name__)
 
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(src_dir))
+@lru_cache(maxsize=None)
+def _api():
+    """
+    Import the async API module on first use, so aiohttp/numpy/requests load
+    after the window is up rather than at controller import.
+    
+    Returns None if aiohttp is not installed; fetches then fall back to the
+    blocking client on a thread pool.
+    """
+    try:
+        from ..api import weather_api_async
+    except ImportError as e:
+        log.warning("Async API unavailable (%s); using blocking requests on a thread pool", e)
+        return None
+    return weather_api_async
+
+@dataclass
+class ProcessedWeather:
+    """GUI-ready weather for one city, as passed to 'on_success'/'on_prefetched'"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10; BUILD.md targets 3.8+),
+    # which is also why no field has a default
+    __slots__ = ('city', 'main', 'description', 'temp_celsius', 'humidity', 'pressure',
+                 'sunrise', 'sunset', 'visibility', 'uv_index', 'hourly_forecast', 'daily_forecast')
+    city: str
+    main: str
+    description: str
+    temp_celsius: float
+    humidity: int
+    pressure: int
+    sunrise: str
+    sunset: str
+    visibility: Optional[float]
+    uv_index: str
+    hourly_forecast: List[Dict]
+    daily_forecast: List[Dict]
+
+# Cities prefetched at once by fetch_many. Each city costs up to two concurrent
+# requests, so this stays well under the session's connection limit (8) and a
+# user-facing fetch always finds a free connection
+_PREFETCH_CONCURRENCY = 2
 
-# Import API module from weather_api
-from api.weather_api import get_weather_info
+# Valid city names: 2-100 letters (incl. German umlauts), spaces, hyphens, apostrophes
+_CITY_RE = re.compile(r"[A-Za-zäöüÄÖÜß '-]{2,100}")
+
+@lru_cache(maxsize=512)
+def _validate_city(city: str) -> tuple:
+    """Pure, memoized body of WeatherController.validate_city_input"""
+    name = city.strip() if city else ""
+    if not name:
+        return False, "City name cannot be empty"
+    
+    # One C-level pass covers both the length bounds and the character set.
+    # strip() may have dropped tabs/newlines, which are not valid characters,
+    # so only surrounding spaces may differ between the input and name
+    if not _CITY_RE.fullmatch(name) or city.strip(' ') != name:
+        if len(name) < 2:
+            return False, "City name is too short"
+        if len(name) > 100:
+            return False, "City name is too long"
+        return False, "City name contains invalid characters"
+    
+    return True, ""
 
 class WeatherController:
-    def __init__(self):
+    def __init__(self, root=None, cache_ttl: Optional[float] = None,
+                 cache_path: Optional[Path] = None, stale_ttl: Optional[float] = None):
+        """
+        Args:
+            root: Optional Tk root; when given, callbacks are posted to the Tk
+                thread with root.after(0, ...) instead of being called directly
+            cache_ttl: Seconds a successful lookup is reused for the same city
+                (default: $WEATHER_APP_CACHE_TTL, else 600)
+            cache_path: JSON file the cache persists to between runs
+                (default: ~/.cache/weather-app/cache.json)
+            stale_ttl: Age up to which an expired entry is still shown while
+                a background request refreshes it (default: 6 * cache_ttl)
+        """
+        self.root = root
         self.current_weather_data = None
         self.current_city = None
         self.callbacks = {
             'on_success': None,
             'on_error': None,
-            'on_loading': None
+            'on_loading': None,
+            'on_prefetched': None
         }
+        
+        # Network I/O runs on a private event loop so the Tk thread never blocks
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        self._session = None  # created lazily inside the loop
+        # Runs the blocking client when aiohttp is unavailable (see _get_weather)
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='weather-fetch')
+        # Sole writer of the cache file, so saves from the loop and Tk threads
+        # never overlap and neither thread blocks on disk I/O (see _save_cache)
+        self._cache_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='weather-cache')
+        self._fetch_seq = 0   # only the newest fetch may update the UI
+        
+        # Successful lookups by normalized city: {city_lower: (epoch_ts, weather_data)},
+        # persisted to disk so a restart within the TTL needs no request
+        if cache_ttl is None:
+            cache_ttl = float(os.environ.get('WEATHER_APP_CACHE_TTL', 600))
+        self._cache_ttl = cache_ttl
+        self._stale_ttl = 6 * cache_ttl if stale_ttl is None else stale_ttl
+        self._cache_path = cache_path or Path.home() / '.cache' / 'weather-app' / 'cache.json'
+        self._cache: Dict[str, tuple] = self._load_cache()
     
     
     def register_callback(self, event: str, callback: Callable):
@@ -31,56 +128,118 @@ class WeatherController:
         Register callback functions for GUI updates
         
         Args:
-            event: Event name ('on_success', 'on_error', 'on_loading')
+            event: Event name ('on_success', 'on_error', 'on_loading', 'on_prefetched')
             callback: Function to call when event occurs
         """
         if event in self.callbacks:
             self.callbacks[event] = callback
-            print(f"✅ Registered callback: {event}")
+            log.debug("Registered callback: %s", event)
     
     def _trigger_callback(self, event: str, *args, **kwargs):
         """Trigger a registered callback"""
         if self.callbacks.get(event):
             self.callbacks[event](*args, **kwargs)
     
+    def _post_callback(self, event: str, *args):
+        """Trigger a callback from the loop thread, on the Tk thread if a root was given"""
+        if self.root is not None:
+            self.root.after(0, self._trigger_callback, event, *args)
+        else:
+            self._trigger_callback(event, *args)
+    
+    def close(self):
+        """Close the HTTP session and stop the background event loop and thread pool"""
+        async def _shutdown():
+            if self._session is not None:
+                await self._session.close()
+                self._session = None
+        
+        asyncio.run_coroutine_threadsafe(_shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._pool.shutdown(wait=False)
+        # Let queued cache saves finish so the last snapshot reaches disk
+        self._cache_writer.shutdown(wait=True)
+    
     # ==================== Weather Data Fetching ====================
     
-    def fetch_weather(self, city: str) -> bool:
+    def fetch_weather(self, city: str):
         """
         Fetch weather data for a given city using Group 1's API
         
+        Validation and the loading callback run immediately; the request itself
+        runs on the background event loop and reports back through callbacks.
+        
         Args:
             city: City name to fetch weather for
             
         Returns:
-            bool: True if successful, False otherwise
+            concurrent.futures.Future: The scheduled fetch (resolves to True if
+            successful; also returned for a stale cache hit being refreshed), True
+            if served fresh from cache, or False if the input was invalid
         """
-        print(f"\n🌤️  Controller: Fetching weather for '{city}'...")
+        log.debug("Fetching weather for %r", city)
         
         # Validate input
         is_valid, error_msg = self.validate_city_input(city)
         if not is_valid:
-            print(f"❌ Validation failed: {error_msg}")
+            log.debug("Validation failed for %r: %s", city, error_msg)
             self._trigger_callback('on_error', "Invalid Input", error_msg)
             return False
         
+        # Recent lookups for the same city are served without a request;
+        # older ones are shown at once and refreshed in the background
+        self._fetch_seq += 1
+        cached, fresh = self._cache_lookup(city)
+        if cached is not None:
+            log.debug("Cache hit for %r (%s)", city, "fresh" if fresh else "stale")
+            self.current_weather_data = cached
+            self.current_city = city
+            self._trigger_callback('on_success', self._process_weather_data(cached, city))
+            # Ends the loading state of any fetch this one supersedes
+            self._trigger_callback('on_loading', False, "")
+            if fresh:
+                return True
+            return asyncio.run_coroutine_threadsafe(
+                self._fetch_async(city, self._fetch_seq, revalidate=True), self._loop)
+        
         # Trigger loading state
         self._trigger_callback('on_loading', True, f"Fetching weather for {city}...")
         
+        return asyncio.run_coroutine_threadsafe(self._fetch_async(city, self._fetch_seq), self._loop)
+    
+    async def _fetch_async(self, city: str, seq: int, revalidate: bool = False) -> bool:
+        """
+        Run one fetch on the event loop; results for superseded fetches are
+        cached but not shown
+        
+        With revalidate=True stale data is already on screen, so failures are
+        only logged instead of reported through 'on_error'.
+        """
         try:
             # Call Group 1's API function
-            print(f"📡 Calling API: get_weather_info('{city}')")
-            weather_data = get_weather_info(city)
+            log.debug("Calling API: get_weather_info_async(%r)", city)
+            weather_data = await self._get_weather(city)
+            
+            # Cache even superseded results, so reselecting the city is instant
+            if weather_data is not None:
+                self._cache[self._cache_key(city)] = (time.time(), weather_data)
+                self._save_cache()
+            
+            if seq != self._fetch_seq:
+                log.debug("Not showing result for %r (newer request pending)", city)
+                return False
             
             if weather_data is None:
-                print(f"❌ API returned None for '{city}'")
-                self._trigger_callback('on_error', 
-                                     "No Data", 
-                                     f"Could not fetch weather data for '{city}'. Please check the city name.")
-                self._trigger_callback('on_loading', False, "")
+                log.warning("API returned no data for %r", city)
+                if revalidate:
+                    return False
+                self._post_callback('on_error', 
+                                    "No Data", 
+                                    f"Could not fetch weather data for '{city}'. Please check the city name.")
+                self._post_callback('on_loading', False, "")
                 return False
             
-            print(f"✅ API returned data: {weather_data}")
+            log.debug("API returned data: %s", weather_data)
             
             # Store current data
             self.current_weather_data = weather_data
@@ -88,29 +247,166 @@ class WeatherController:
             
             # Process data for GUI display
             processed_data = self._process_weather_data(weather_data, city)
-            print(f"✅ Processed data: {processed_data}")
+            log.debug("Processed data: %s", processed_data)
             
             # Trigger success callback
-            self._trigger_callback('on_success', processed_data)
-            self._trigger_callback('on_loading', False, "")
+            self._post_callback('on_success', processed_data)
+            self._post_callback('on_loading', False, "")
             
             return True
             
         except Exception as e:
             # Handle unexpected errors
-            print(f"❌ Exception occurred: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Fetch failed for %r", city)
+            if revalidate:
+                return False
             
-            self._trigger_callback('on_error', 
-                                 "Error", 
-                                 f"An unexpected error occurred: {str(e)}")
-            self._trigger_callback('on_loading', False, "")
+            self._post_callback('on_error', 
+                                "Error", 
+                                f"An unexpected error occurred: {str(e)}")
+            self._post_callback('on_loading', False, "")
             return False
     
+    def _get_session(self):
+        """Return the shared HTTP session, creating it on first use (loop thread only)"""
+        if self._session is None:
+            self._session = _api().create_session()
+        return self._session
+    
+    async def _get_weather(self, city: str) -> Optional[Dict]:
+        """Fetch one city with the async client, or the blocking one on the thread pool"""
+        api = _api()
+        if api is not None:
+            return await api.get_weather_info_async(city, session=self._get_session())
+        from ..api.weather_api import get_weather_info
+        return await self._loop.run_in_executor(self._pool, get_weather_info, city)
+    
+    def fetch_many(self, cities):
+        """
+        Prefetch several cities concurrently without touching the main display
+        
+        At most _PREFETCH_CONCURRENCY cities are in flight at once. Each city is cached on its own and reported through 'on_prefetched'
+        with (city, processed_data) as soon as its own requests finish.
+        
+        Args:
+            cities: Iterable of city names
+            
+        Returns:
+            concurrent.futures.Future: Resolves to the list of processed data
+            (None for cities that failed), in input order
+        """
+        return asyncio.run_coroutine_threadsafe(self._fetch_many(list(cities)), self._loop)
+    
+    async def _fetch_many(self, cities) -> list:
+        limit = asyncio.Semaphore(_PREFETCH_CONCURRENCY)
+        
+        async def prefetch(city):
+            async with limit:
+                return await self._prefetch_one(city)
+        
+        results = await asyncio.gather(*(prefetch(city) for city in cities))
+        self._save_cache()
+        return results
+    
+    async def _prefetch_one(self, city: str) -> Optional[ProcessedWeather]:
+        weather_data = self._cache_get(city)
+        if weather_data is None:
+            try:
+                weather_data = await self._get_weather(city)
+            except Exception as e:
+                log.warning("Prefetch failed for %r: %s", city, e)
+                return None
+            if weather_data is None:
+                return None
+            self._cache[self._cache_key(city)] = (time.time(), weather_data)
+        
+        processed_data = self._process_weather_data(weather_data, city)
+        self._post_callback('on_prefetched', city, processed_data)
+        return processed_data
+    
+    # ==================== Cache ====================
+    
+    @staticmethod
+    def _cache_key(city: str) -> str:
+        return city.strip().lower()
+    
+    def _cache_get(self, city: str) -> Optional[Dict]:
+        """Return cached weather data for city if younger than the TTL, else None"""
+        data, fresh = self._cache_lookup(city)
+        return data if fresh else None
+    
+    def _cache_lookup(self, city: str) -> tuple:
+        """
+        Look up cached weather data for city
+        
+        Returns:
+            tuple: (data, True) within the TTL, (data, False) within the stale
+            window, else (None, False)
+        """
+        entry = self._cache.get(self._cache_key(city))
+        if entry:
+            age = time.time() - entry[0]
+            if age < self._cache_ttl:
+                return entry[1], True
+            if age < self._stale_ttl:
+                return entry[1], False
+        return None, False
+    
+    def invalidate(self, city: Optional[str] = None):
+        """
+        Drop cached weather data so the next fetch goes to the API
+        
+        Args:
+            city: City to drop, or None to clear the whole cache
+        """
+        if city is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(self._cache_key(city), None)
+        self._save_cache()
+    
+    def _load_cache(self) -> Dict[str, tuple]:
+        """Load the on-disk cache, skipping entries past the stale window"""
+        try:
+            raw = json.loads(self._cache_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning("Ignoring unreadable cache file %s: %s", self._cache_path, e)
+            return {}
+        
+        cutoff = time.time() - self._stale_ttl
+        try:
+            return {
+                key: (entry['ts'], entry['data'])
+                for key, entry in raw.items()
+                if entry['ts'] >= cutoff
+            }
+        except (AttributeError, KeyError, TypeError) as e:
+            log.warning("Ignoring malformed cache file %s: %s", self._cache_path, e)
+            return {}
+    
+    def _save_cache(self):
+        """Snapshot the cache and queue it for writing on the cache writer thread"""
+        snapshot = {key: {'ts': ts, 'data': data} for key, (ts, data) in dict(self._cache).items()}
+        try:
+            self._cache_writer.submit(self._write_cache, snapshot)
+        except RuntimeError:
+            log.debug("Cache writer closed; not saving")
+    
+    def _write_cache(self, snapshot: Dict):
+        """Write a cache snapshot to disk atomically (temp file + os.replace)"""
+        tmp_path = self._cache_path.with_suffix('.tmp')
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(snapshot), encoding='utf-8')
+            os.replace(tmp_path, self._cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            log.warning("Could not write cache file %s: %s", self._cache_path, e)
+    
     # ==================== Data Processing ====================
     
-    def _process_weather_data(self, data: Dict, city: str) -> Dict:
+    def _process_weather_data(self, data: Dict, city: str) -> ProcessedWeather:
         """
         Process Group 1's API data into GUI-friendly format
         
@@ -134,51 +430,27 @@ class WeatherController:
             city: City name
             
         Returns:
-            Dict: Processed data ready for GUI display
+            ProcessedWeather: Processed data ready for GUI display
         """
-        from api.weather_api import format_sunrise_sunset
-        
-        processed = {
-            # Location info
-            'city': city.title(),
-            'country': '',  # Group 1's API doesn't provide country
-            
-            # Weather description
-            'main': data.get('weather_condition', 'Unknown'),
-            'description': data.get('description', '').title(),
-            
-            # Temperature (already in Celsius from Group 1)
-            'temp_celsius': data.get('temperature', 0),
-            'feels_like_celsius': data.get('temperature', 0),  # Not provided, use same temp
-            
-            # Other weather data
-            'humidity': data.get('humidity', 0),
-            'pressure': data.get('pressure', 0),
-            'wind_speed': 0,  # Not provided by Group 1's API
-            
-            # Sunrise/Sunset/Visibility/UV Index
-            'sunrise': format_sunrise_sunset(
-                data.get('sunrise'),
-                data.get('timezone', 0)
-            ) if data.get('sunrise') else "N/A",
-            'sunset': format_sunrise_sunset(
-                data.get('sunset'),
-                data.get('timezone', 0)
-            ) if data.get('sunset') else "N/A",
-            'visibility': data.get('visibility'),
-            'uv_index': data.get('uv_index', 'N/A'),
-            
-            # Hourly forecast
-            'hourly_forecast': data.get('hourly_forecast', []),
-            
-            # 15-day forecast
-            'daily_forecast': data.get('daily_forecast', []),
-            
-            # Raw data
-            'raw': data
-        }
+        from ..api.weather_api import format_sunrise_sunset
         
-        return processed
+        get = data.get
+        timezone_offset = get('timezone', 0)
+        sunrise, sunset = get('sunrise'), get('sunset')
+        return ProcessedWeather(
+            city=city.title(),
+            main=get('weather_condition', 'Unknown'),
+            description=get('description', '').title(),
+            temp_celsius=get('temperature', 0),  # already in Celsius from Group 1
+            humidity=get('humidity', 0),
+            pressure=get('pressure', 0),
+            sunrise=format_sunrise_sunset(sunrise, timezone_offset) if sunrise else "N/A",
+            sunset=format_sunrise_sunset(sunset, timezone_offset) if sunset else "N/A",
+            visibility=get('visibility'),
+            uv_index=get('uv_index', 'N/A'),
+            hourly_forecast=get('hourly_forecast', []),
+            daily_forecast=get('daily_forecast', []),
+        )
     
     # ==================== Data Retrieval ====================
     
@@ -244,21 +516,7 @@ class WeatherController:
         Returns:
             tuple: (is_valid, error_message)
         """
-        if not city or not city.strip():
-            return False, "City name cannot be empty"
-        
-        if len(city.strip()) < 2:
-            return False, "City name is too short"
-        
-        if len(city.strip()) > 100:
-            return False, "City name is too long"
-        
-        # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        valid_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ -'äöüÄÖÜß")
-        if not all(c in valid_chars for c in city):
-            return False, "City name contains invalid characters"
-        
-        return True, ""
+        return _validate_city(city)
     
     # ==================== Refresh Data ====================
     
@@ -270,6 +528,7 @@ class WeatherController:
             bool: True if successful, False otherwise
         """
         if self.current_city:
+            self.invalidate(self.current_city)
             return self.fetch_weather(self.current_city)
         else:
             self._trigger_callback('on_error', 
@@ -281,7 +540,9 @@ class WeatherController:
 # ==================== Test Code ====================
 
 if __name__ == "__main__":
-    """Test the controller independently"""
+    """Test the controller independently (from the project root: python -m src.ui.weather_controller)"""
+    
+    logging.basicConfig(level=logging.DEBUG, format="%(levelname)s %(name)s: %(message)s")
     
     print("=" * 60)
     print("Testing Weather Controller")
@@ -293,11 +554,11 @@ if __name__ == "__main__":
     # Define test callback functions
     def on_success(data):
         print(f"\n✅ SUCCESS CALLBACK")
-        print(f"   City: {data['city']}")
-        print(f"   Temperature: {data['temp_celsius']:.1f}°C")
-        print(f"   Condition: {data['description']}")
-        print(f"   Humidity: {data['humidity']}%")
-        print(f"   Pressure: {data['pressure']} hPa")
+        print(f"   City: {data.city}")
+        print(f"   Temperature: {data.temp_celsius:.1f}°C")
+        print(f"   Condition: {data.description}")
+        print(f"   Humidity: {data.humidity}%")
+        print(f"   Pressure: {data.pressure} hPa")
     
     def on_error(title, message):
         print(f"\n❌ ERROR CALLBACK")
@@ -316,12 +577,16 @@ if __name__ == "__main__":
     print("\n" + "=" * 60)
     print("Test 1: Fetch weather for London")
     print("=" * 60)
-    controller.fetch_weather("London")
+    future = controller.fetch_weather("London")
+    if future:
+        future.result()
     
     print("\n" + "=" * 60)
     print("Test 2: Fetch weather for Berlin")
     print("=" * 60)
-    controller.fetch_weather("Berlin")
+    future = controller.fetch_weather("Berlin")
+    if future:
+        future.result()
     
     print("\n" + "=" * 60)
     print("Test 3: Invalid city (empty)")
@@ -334,6 +599,8 @@ if __name__ == "__main__":
     print(f"20°C in Fahrenheit: {controller.format_temperature(20, 'fahrenheit')}")
     print(f"20°C in Celsius: {controller.format_temperature(20, 'celsius')}")
     
+    controller.close()
+    
     print("\n" + "=" * 60)
     print("Tests completed!")
     print("=" * 60)
\ No newline at end of file
@@ -3,7 +3,56 @@ Reusable UI widgets and drawing helpers for the Weather App.
 """
 import math
 import tkinter as tk
+from functools import lru_cache
+from types import SimpleNamespace
 from .icon_loader import load_icon, get_icon_for_condition
+from .theme import FONTS
+
+
+# (start phase, sweep) of each corner arc in units of pi, in drawing order:
+# top-left, top-right, bottom-right, bottom-left
+_CORNER_ARCS = ((1.5, 0.5), (1.0, -0.5), (0.5, -0.5), (0.0, -0.5))
+
+
+def _build_corner_units(segments):
+    """Return per-corner lists of (cos, sin) for segments + 1 points along each arc."""
+    return tuple(
+        [(math.cos(math.pi * (phase + i / segments * sweep)),
+          math.sin(math.pi * (phase + i / segments * sweep)))
+         for i in range(segments + 1)]
+        for phase, sweep in _CORNER_ARCS
+    )
+
+
+# Unit-circle tables by segment count; the default is built at import
+_CORNER_UNITS = {12: _build_corner_units(12)}
+
+# Rounded-rect outlines relative to (0, 0), keyed by (w, h, radius, segments);
+# nearly every card uses the same shape, so each is computed once
+_ROUND_RECT_CACHE = {}
+
+
+def _rounded_rect_points(w, h, radius, segments=12):
+    """Return the flat polygon point list for a w x h rounded rectangle at (0, 0)."""
+    key = (w, h, radius, segments)
+    points = _ROUND_RECT_CACHE.get(key)
+    if points is not None:
+        return points
+
+    units = _CORNER_UNITS.get(segments)
+    if units is None:
+        units = _CORNER_UNITS[segments] = _build_corner_units(segments)
+
+    radius = min(radius, w / 2, h / 2)
+    centers = ((radius, radius), (w - radius, radius), (w - radius, h - radius), (radius, h - radius))
+    points = []
+    for (cx, cy), arc in zip(centers, units):
+        for cos_a, sin_a in arc:
+            points.append(cx + radius * cos_a)
+            points.append(cy + radius * sin_a)
+
+    _ROUND_RECT_CACHE[key] = points
+    return points
 
 
 def create_rounded_rect(canvas, x1, y1, x2, y2, radius, fill, outline=""):
@@ -17,38 +66,19 @@ def create_rounded_rect(canvas, x1, y1, x2, y2, radius, fill, outline=""):
         radius: Border radius in pixels
         fill: Fill color
         outline: Outline color (optional)
+
+    Returns:
+        int: Canvas item id of the polygon
     """
-    radius = min(radius, (x2 - x1) / 2, (y2 - y1) / 2)
-    points = []
-    segments = 12
-
-    for i in range(segments + 1):
-        angle = math.pi * (1.5 + i / segments * 0.5)
-        px = x1 + radius + radius * math.cos(angle)
-        py = y1 + radius + radius * math.sin(angle)
-        points.append((px, py))
-
-    for i in range(segments + 1):
-        angle = math.pi * (1.0 - i / segments * 0.5)
-        px = x2 - radius + radius * math.cos(angle)
-        py = y1 + radius + radius * math.sin(angle)
-        points.append((px, py))
-
-    for i in range(segments + 1):
-        angle = math.pi * (0.5 - i / segments * 0.5)
-        px = x2 - radius + radius * math.cos(angle)
-        py = y2 - radius + radius * math.sin(angle)
-        points.append((px, py))
-
-    for i in range(segments + 1):
-        angle = math.pi * (0.0 - i / segments * 0.5)
-        px = x1 + radius + radius * math.cos(angle)
-        py = y2 - radius + radius * math.sin(angle)
-        points.append((px, py))
-
-    flat_points = [c for p in points for c in p]
+    flat_points = _rounded_rect_points(x2 - x1, y2 - y1, radius)
+    if x1 or y1:
+        # Translate the cached outline: x values sit at even indices, y at odd
+        shape = flat_points
+        flat_points = list(shape)
+        flat_points[0::2] = [x + x1 for x in shape[0::2]]
+        flat_points[1::2] = [y + y1 for y in shape[1::2]]
     outline_color = outline or fill
-    canvas.create_polygon(flat_points, fill=fill, outline=outline_color, smooth=True, width=0)
+    return canvas.create_polygon(flat_points, fill=fill, outline=outline_color, smooth=True, width=0)
 
 
 def create_rounded_button(parent, text, command, colors):
@@ -62,7 +92,7 @@ def create_rounded_button(parent, text, command, colors):
     def draw_button(fill_color):
         btn_canvas.delete("all")
         btn_canvas.create_oval(2, 2, 30, 30, fill=fill_color, outline=fill_color, width=0)
-        btn_canvas.create_text(16, 16, text=text, font=('Arial', 11, 'bold'), fill=colors['text_primary'])
+        btn_canvas.create_text(16, 16, text=text, font=FONTS['nav_button'], fill=colors['text_primary'])
 
     draw_button(colors['card_bg'])
 
@@ -82,115 +112,134 @@ def create_rounded_button(parent, text, command, colors):
     return btn_canvas
 
 
-def create_hourly_card(parent, time, icon, temp, colors):
+@lru_cache(maxsize=256)
+def _get_icon(name, size):
+    """Resolve an icon name or condition to a PhotoImage once per (name, size)."""
+    # Try to load icon by name first, then by condition
+    return load_icon(name, size) or get_icon_for_condition(name, size) or load_icon('default', size)
+
+
+def _resolve_card_icon(icon):
+    """Resolve a card icon given as PhotoImage or icon name string; None if unavailable."""
+    if isinstance(icon, tk.PhotoImage):
+        return icon
+    if isinstance(icon, str):
+        return _get_icon(icon, (32, 32))
+    return None
+
+
+# Card geometry and vertical item centers (matching the former packed-label layout)
+CARD_WIDTH = 90
+CARD_HEIGHT = 180
+_CARD_HEADER_Y = 18
+_CARD_ICON_Y = 50
+_CARD_TEMP_Y = 88
+
+
+class _CardItem:
     """
-    Create a single hourly forecast card.
-    
-    Args:
-        parent: Parent widget
-        time: Time string (e.g., "14:00")
-        icon: Icon name (str) or PhotoImage object
-        temp: Temperature string (e.g., "20°C")
-        colors: Color dictionary
+    Label-like handle for a text and/or image item on a card canvas.
+
+    configure()/config() accept the Label options the app uses (text, image, fg)
+    and map them to itemconfigure on the underlying canvas items.
     """
-    card_canvas = tk.Canvas(
-        parent, bg=colors['bg_medium'],
-        highlightthickness=0, width=90, height=180
-    )
-    card_canvas.pack_propagate(False)
 
-    create_rounded_rect(card_canvas, 0, 0, 90, 180, 10, fill=colors['card_bg'], outline=colors['card_bg'])
+    def __init__(self, canvas, text_id=None, image_id=None):
+        self._canvas = canvas
+        self._text_id = text_id
+        self._image_id = image_id
+        self.image = None  # keeps the shown PhotoImage alive, like Label.image
+
+    def configure(self, **options):
+        if self._image_id is not None and 'image' in options:
+            self._canvas.itemconfigure(self._image_id, image=options['image'])
+        if self._text_id is not None:
+            text_options = {}
+            if 'text' in options:
+                text_options['text'] = options['text']
+            if 'fg' in options:
+                text_options['fill'] = options['fg']
+            if text_options:
+                self._canvas.itemconfigure(self._text_id, **text_options)
+
+    config = configure
 
-    content_canvas = tk.Canvas(
-        card_canvas, bg=colors['card_bg'],
-        highlightthickness=0, width=90, height=180
+
+def _create_forecast_card(canvas, x, y, header, icon, temp, colors):
+    """
+    Draw a forecast card as items on canvas with its top-left at (x, y).
+
+    All of a card's items share one tag, so move_to(x) repositions the card
+    with a single canvas.move; see create_hourly_card for the returned handles.
+    """
+    rect_id = create_rounded_rect(canvas, x, y, x + CARD_WIDTH, y + CARD_HEIGHT, 10, fill=colors['card_bg'], outline=colors['card_bg'])
+    tag = f"card{rect_id}"
+    canvas.addtag_withtag(tag, rect_id)
+
+    cx = x + CARD_WIDTH // 2
+    header_id = canvas.create_text(cx, y + _CARD_HEADER_Y, text=header, font=FONTS['card_header'], fill=colors['text_secondary'], tags=tag)
+    icon_img = _resolve_card_icon(icon)
+    image_id = canvas.create_image(cx, y + _CARD_ICON_Y, image=icon_img or '', tags=tag)
+    # Shares the icon slot; shows status text such as "Loading" when there is no image
+    icon_text_id = canvas.create_text(cx, y + _CARD_ICON_Y, text='', font=FONTS['card_header'], fill=colors['text_secondary'], tags=tag)
+    temp_id = canvas.create_text(cx, y + _CARD_TEMP_Y, text=temp, font=FONTS['card_temp'], fill=colors['text_primary'], tags=tag)
+
+    icon_label = _CardItem(canvas, text_id=icon_text_id, image_id=image_id)
+    icon_label.image = icon_img  # Keep reference
+    card = SimpleNamespace(
+        tag=tag,
+        x=x,
+        header_label=_CardItem(canvas, text_id=header_id),
+        icon_label=icon_label,
+        temp_label=_CardItem(canvas, text_id=temp_id),
     )
-    content_canvas.pack_propagate(False)
-    create_rounded_rect(content_canvas, 0, 0, 90, 180, 10, fill=colors['card_bg'], outline=colors['card_bg'])
 
-    card_canvas.create_window(0, 0, window=content_canvas, anchor='nw', width=90, height=180)
+    def move_to(new_x):
+        if new_x != card.x:
+            canvas.move(tag, new_x - card.x, 0)
+            card.x = new_x
 
-    card = tk.Frame(content_canvas, bg=colors['card_bg'], width=90, height=180)
-    content_canvas.create_window(0, 0, window=card, anchor='nw', width=90, height=180)
+    card.move_to = move_to
+    return card
 
-    time_label = tk.Label(card, text=time, font=('Arial', 11), bg=colors['card_bg'], fg=colors['text_secondary'])
-    time_label.pack(pady=(8, 3))
-    
-    # Handle icon - can be PhotoImage or icon name string
-    icon_label = tk.Label(card, bg=colors['card_bg'])
-    if isinstance(icon, tk.PhotoImage):
-        icon_label.config(image=icon)
-        icon_label.image = icon  # Keep reference
-    elif isinstance(icon, str):
-        # Try to load icon by name first, then by condition
-        icon_img = load_icon(icon, size=(32, 32)) or get_icon_for_condition(icon, size=(32, 32)) or load_icon('default', size=(32, 32))
-        if icon_img:
-            icon_label.config(image=icon_img)
-            icon_label.image = icon_img  # Keep reference
-    icon_label.pack(pady=4)
+
+def create_hourly_card(canvas, x, y, time, icon, temp, colors):
+    """
+    Draw a single hourly forecast card on a canvas.
     
-    temp_label = tk.Label(card, text=temp, font=('Arial', 18, 'bold'), bg=colors['card_bg'], fg=colors['text_primary'])
-    temp_label.pack(pady=(3, 8))
+    Args:
+        canvas: Canvas to draw on (the forecast strip)
+        x, y: Top-left corner of the card
+        time: Time string (e.g., "14:00")
+        icon: Icon name (str) or PhotoImage object
+        temp: Temperature string (e.g., "20°C")
+        colors: Color dictionary
 
-    card_canvas.temp_label = temp_label
-    card_canvas.icon_label = icon_label
-    card_canvas.time_label = time_label
-    card_canvas.card_frame = card
-    return card_canvas
+    Returns:
+        SimpleNamespace: header_label/time_label, icon_label and temp_label
+        handles whose configure() updates the drawn items, plus move_to(x)
+    """
+    card = _create_forecast_card(canvas, x, y, time, icon, temp, colors)
+    card.time_label = card.header_label
+    return card
 
 
-def create_daily_card(parent, day, icon, temp_str, colors):
+def create_daily_card(canvas, x, y, day, icon, temp_str, colors):
     """
-    Create a daily forecast card (same layout as hourly).
+    Draw a daily forecast card on a canvas (same layout as hourly).
     
     Args:
-        parent: Parent widget
+        canvas: Canvas to draw on (the forecast strip)
+        x, y: Top-left corner of the card
         day: Day string (e.g., "Mon 27")
         icon: Icon name (str) or PhotoImage object
         temp_str: Temperature string (e.g., "20°/15°")
         colors: Color dictionary
-    """
-    card_canvas = tk.Canvas(
-        parent, bg=colors['bg_medium'],
-        highlightthickness=0, width=90, height=180
-    )
-    card_canvas.pack_propagate(False)
-
-    create_rounded_rect(card_canvas, 0, 0, 90, 180, 10, fill=colors['card_bg'], outline=colors['card_bg'])
-
-    content_canvas = tk.Canvas(
-        card_canvas, bg=colors['card_bg'],
-        highlightthickness=0, width=90, height=180
-    )
-    content_canvas.pack_propagate(False)
-    create_rounded_rect(content_canvas, 0, 0, 90, 180, 10, fill=colors['card_bg'], outline=colors['card_bg'])
-
-    card_canvas.create_window(0, 0, window=content_canvas, anchor='nw', width=90, height=180)
 
-    card = tk.Frame(content_canvas, bg=colors['card_bg'], width=90, height=180)
-    content_canvas.create_window(0, 0, window=card, anchor='nw', width=90, height=180)
-
-    day_label = tk.Label(card, text=day, font=('Arial', 11), bg=colors['card_bg'], fg=colors['text_secondary'])
-    day_label.pack(pady=(8, 3))
-    
-    # Handle icon - can be PhotoImage or icon name string
-    icon_label = tk.Label(card, bg=colors['card_bg'])
-    if isinstance(icon, tk.PhotoImage):
-        icon_label.config(image=icon)
-        icon_label.image = icon  # Keep reference
-    elif isinstance(icon, str):
-        # Try to load icon by name first, then by condition
-        icon_img = load_icon(icon, size=(32, 32)) or get_icon_for_condition(icon, size=(32, 32)) or load_icon('default', size=(32, 32))
-        if icon_img:
-            icon_label.config(image=icon_img)
-            icon_label.image = icon_img  # Keep reference
-    icon_label.pack(pady=4)
-    
-    temp_label = tk.Label(card, text=temp_str, font=('Arial', 18, 'bold'), bg=colors['card_bg'], fg=colors['text_primary'])
-    temp_label.pack(pady=(3, 8))
-
-    card_canvas.day_label = day_label
-    card_canvas.icon_label = icon_label
-    card_canvas.temp_label = temp_label
-    card_canvas.card_frame = card
-    return card_canvas
+    Returns:
+        SimpleNamespace: header_label/day_label, icon_label and temp_label
+        handles whose configure() updates the drawn items, plus move_to(x)
+    """
+    card = _create_forecast_card(canvas, x, y, day, icon, temp_str, colors)
+    card.day_label = card.header_label
+    return card